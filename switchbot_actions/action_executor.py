@@ -3,6 +3,7 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from functools import wraps
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Generic, TypeVar
 
 import httpx
@@ -55,6 +56,10 @@ class ActionExecutor(ABC, Generic[T_Action]):
         """Executes the action."""
         pass
 
+    async def close(self) -> None:
+        """Releases any resources held by the executor."""
+        pass
+
 
 class ShellCommandExecutor(ActionExecutor):
     """Executes a shell command."""
@@ -87,6 +92,37 @@ class ShellCommandExecutor(ActionExecutor):
 class WebhookExecutor(ActionExecutor):
     """Sends a webhook."""
 
+    def __init__(self, action: WebhookAction):
+        super().__init__(action)
+        self._client: httpx.AsyncClient | None = None
+        self._closed = False
+        self._in_flight = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Returns the HTTP client, reused across sends to keep connections alive."""
+        if self._client is None:
+            # Webhooks are independent calls, so cookies set by one response
+            # must not be sent with the next request
+            self._client = httpx.AsyncClient(
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """
+        Closes the pooled HTTP client once no request is using it. Sends after
+        close, e.g. from a duration timer that fires after a reload, use a
+        one-off client instead of creating a new pooled one.
+        """
+        self._closed = True
+        if self._in_flight == 0:
+            await self._close_client()
+
+    async def _close_client(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
     @measure_execution_time
     async def execute(self, state: StateObject) -> None:
         url = state.format(self._action_config.url)
@@ -105,40 +141,62 @@ class WebhookExecutor(ActionExecutor):
     async def _send_request(
         self, url: str, method: str, payload: dict | list | str, headers: dict
     ) -> None:
-        try:
+        if self._closed:
             async with httpx.AsyncClient() as client:
-                if method == "POST":
-                    if isinstance(payload, (dict, list)):
-                        response = await client.post(
-                            url, json=payload, headers=headers, timeout=10
-                        )
-                    else:
-                        if not any(k.lower() == "content-type" for k in headers):
-                            headers["Content-Type"] = "text/plain"
-                        response = await client.post(
-                            url, content=payload, headers=headers, timeout=10
-                        )
-                elif method == "GET":
-                    response = await client.get(
-                        url, params=payload, headers=headers, timeout=10
-                    )
-                else:
-                    logger.error(f"Unsupported HTTP method for webhook: {method}")
-                    return
+                await self._send_with_client(client, url, method, payload, headers)
+            return
 
-                if 200 <= response.status_code < 300:
-                    logger.debug(
-                        f"Webhook to {url} successful with status "
-                        f"{response.status_code}"
+        self._in_flight += 1
+        try:
+            await self._send_with_client(
+                self._get_client(), url, method, payload, headers
+            )
+        finally:
+            self._in_flight -= 1
+            if self._closed and self._in_flight == 0:
+                # close() was called while this request was in flight
+                await self._close_client()
+
+    async def _send_with_client(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        method: str,
+        payload: dict | list | str,
+        headers: dict,
+    ) -> None:
+        try:
+            if method == "POST":
+                if isinstance(payload, (dict, list)):
+                    response = await client.post(
+                        url, json=payload, headers=headers, timeout=10
                     )
                 else:
-                    response_body_preview = (
-                        response.text[:200] if response.text else "(empty)"
-                    )
-                    logger.error(
-                        f"Webhook to {url} failed with status {response.status_code}. "
-                        f"Response: {response_body_preview}"
+                    if not any(k.lower() == "content-type" for k in headers):
+                        headers["Content-Type"] = "text/plain"
+                    response = await client.post(
+                        url, content=payload, headers=headers, timeout=10
                     )
+            elif method == "GET":
+                response = await client.get(
+                    url, params=payload, headers=headers, timeout=10
+                )
+            else:
+                logger.error(f"Unsupported HTTP method for webhook: {method}")
+                return
+
+            if 200 <= response.status_code < 300:
+                logger.debug(
+                    f"Webhook to {url} successful with status {response.status_code}"
+                )
+            else:
+                response_body_preview = (
+                    response.text[:200] if response.text else "(empty)"
+                )
+                logger.error(
+                    f"Webhook to {url} failed with status {response.status_code}. "
+                    f"Response: {response_body_preview}"
+                )
         except httpx.RequestError as e:
             logger.error(f"Webhook failed: {e}")
 
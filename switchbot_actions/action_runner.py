@@ -30,6 +30,11 @@ class ActionRunner(Generic[T]):
     async def run(self, state: T) -> None:
         await self._trigger.process_state(state)
 
+    async def close(self) -> None:
+        """Releases the resources held by this rule's action executors."""
+        for executor in self._executors:
+            await executor.close()
+
     async def execute_actions(self, state: T) -> None:
         name = self._config.name
         logger.debug(
@@ -26,6 +26,8 @@ class Application:
         self.cli_args = cli_args
         self.stopping = False
         self.is_reloading = False
+        # Strong references keep pending background tasks from being collected
+        self._background_tasks: set[asyncio.Task] = set()
 
         setup_logging(self.settings.logging)
 
@@ -43,9 +45,18 @@ class Application:
         qos: int,
         retain: bool,
     ) -> None:
-        asyncio.create_task(
+        if not self.is_reloading:
+            # Queuing is synchronous, so no task is needed outside a reload
+            mqtt_component = cast(MqttClient, self._components.get("mqtt"))
+            mqtt_component.publish_nowait(
+                topic=topic, payload=payload, qos=qos, retain=retain
+            )
+            return
+        task = asyncio.create_task(
             self._handle_publish_request_async(sender, topic, payload, qos, retain)
         )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
     async def _handle_publish_request_async(
         self,
@@ -11,6 +11,10 @@ from ruamel.yaml.error import YAMLError
 from .config import AppSettings
 from .error import ConfigError, format_validation_error, get_error_snippet
 
+# Round-trip mode keeps the line/column info used in error snippets; the
+# loader is reusable, so it is built once at import time
+_yaml_loader = YAML(typ="rt")
+
 
 def _set_nested_value(d: dict, key_path: str, value: Any):
     keys = key_path.split(".")
@@ -21,11 +25,10 @@ def _set_nested_value(d: dict, key_path: str, value: Any):
 
 def load_settings_from_cli(args: argparse.Namespace) -> AppSettings:
     config_data = {}
-    yaml = YAML(typ="rt")
     config_path = Path(args.config)
     try:
         with open(config_path, "r") as f:
-            config_data = yaml.load(f) or {}
+            config_data = _yaml_loader.load(f) or {}
     except FileNotFoundError:
         print(
             f"Configuration file not found at {config_path}, using defaults.",
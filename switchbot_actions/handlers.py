@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import operator
 from typing import Any, Optional
 
 import aiomqtt
@@ -8,7 +9,7 @@ from switchbot import SwitchBotAdvertisement
 from .action_executor import create_action_executor
 from .action_runner import ActionRunner
 from .component import BaseComponent
-from .config import AutomationSettings
+from .config import AutomationIf, AutomationSettings
 from .signals import mqtt_message_received, switchbot_advertisement_received
 from .state import (
     MqttState,
@@ -16,15 +17,28 @@ from .state import (
     StateSnapshot,
     SwitchBotState,
     _get_key_from_raw_event,
+    _is_template,
     create_state_object,
 )
 from .store import StateStore
-from .triggers import DurationTrigger, EdgeTrigger
+from .triggers import DurationTrigger, EdgeTrigger, _compile_condition
 
 logger = logging.getLogger(__name__)
 automation_logger = logging.getLogger("switchbot_actions.automation")
 
 
+def _get_literal_address(if_config: AutomationIf) -> Optional[str]:
+    """
+    Returns the address a rule is pinned to by an 'address' equality condition,
+    or None if the rule can match advertisements from any device.
+    """
+    condition = if_config.conditions.get("address")
+    if not isinstance(condition, str) or _is_template(condition):
+        return None
+    op, address, _ = _compile_condition(condition)
+    return address if op is operator.eq else None
+
+
 class AutomationHandler(BaseComponent[AutomationSettings]):
     """
     Handles automation rules by dispatching signals to appropriate
@@ -35,6 +49,10 @@ class AutomationHandler(BaseComponent[AutomationSettings]):
         super().__init__(settings)
         self._switchbot_runners: list[ActionRunner[SwitchBotState]] = []
         self._mqtt_runners: list[ActionRunner[MqttState]] = []
+        self._switchbot_runners_by_address: dict[
+            str, list[ActionRunner[SwitchBotState]]
+        ] = {}
+        self._unanchored_switchbot_runners: list[ActionRunner[SwitchBotState]] = []
         self._state_store = state_store
         self._settings = settings
 
@@ -44,6 +62,9 @@ class AutomationHandler(BaseComponent[AutomationSettings]):
         """Clears and re-populates the action runners from settings."""
         self._switchbot_runners.clear()
         self._mqtt_runners.clear()
+        pinned_switchbot_runners: list[
+            tuple[ActionRunner[SwitchBotState], Optional[str]]
+        ] = []
 
         for config in settings.rules:
             executors = [
@@ -58,8 +79,10 @@ class AutomationHandler(BaseComponent[AutomationSettings]):
                     if config.if_block.duration is not None
                     else EdgeTrigger[SwitchBotState](config.if_block)
                 )
-                self._switchbot_runners.append(
-                    ActionRunner[SwitchBotState](config, executors, trigger)
+                runner = ActionRunner[SwitchBotState](config, executors, trigger)
+                self._switchbot_runners.append(runner)
+                pinned_switchbot_runners.append(
+                    (runner, _get_literal_address(config.if_block))
                 )
             elif source == "mqtt":
                 trigger = (
@@ -71,12 +94,30 @@ class AutomationHandler(BaseComponent[AutomationSettings]):
                     ActionRunner[MqttState](config, executors, trigger)
                 )
 
+        self._index_switchbot_runners(pinned_switchbot_runners)
+
         logger.info(
             f"AutomationHandler initialized/updated with "
             f"{len(self._switchbot_runners)} switchbot and "
             f"{len(self._mqtt_runners)} mqtt action runner(s)."
         )
 
+    def _index_switchbot_runners(
+        self, pinned: list[tuple[ActionRunner[SwitchBotState], Optional[str]]]
+    ) -> None:
+        """
+        Groups switchbot runners by the address their rule is pinned to, so an
+        advertisement is only evaluated against rules that can match it.
+        Each bucket keeps the original rule order and includes unpinned rules.
+        """
+        self._unanchored_switchbot_runners = [
+            runner for runner, address in pinned if address is None
+        ]
+        self._switchbot_runners_by_address = {
+            address: [runner for runner, pin in pinned if pin is None or pin == address]
+            for address in {address for _, address in pinned if address is not None}
+        }
+
     def _is_enabled(self, settings: Optional[AutomationSettings] = None) -> bool:
         # Note: Uses provided settings or falls back to self.settings.
         # This is crucial for apply_new_settings to determine future state.
@@ -92,6 +133,7 @@ class AutomationHandler(BaseComponent[AutomationSettings]):
         logger.info("AutomationHandler stopping: disconnecting from signals.")
         switchbot_advertisement_received.disconnect(self.handle_switchbot_event)
         mqtt_message_received.disconnect(self.handle_mqtt_event)
+        await self._close_runners()
 
     def _require_restart(self, new_settings: AutomationSettings) -> bool:
         return False
@@ -101,11 +143,21 @@ class AutomationHandler(BaseComponent[AutomationSettings]):
         switchbot_advertisement_received.disconnect(self.handle_switchbot_event)
         mqtt_message_received.disconnect(self.handle_mqtt_event)
 
+        await self._close_runners()
         self._initialize_runners(new_settings)
 
         switchbot_advertisement_received.connect(self.handle_switchbot_event)
         mqtt_message_received.connect(self.handle_mqtt_event)
 
+    async def _close_runners(self) -> None:
+        """Closes the executors of the current runners before they are dropped."""
+        await asyncio.gather(
+            *[
+                runner.close()
+                for runner in [*self._switchbot_runners, *self._mqtt_runners]
+            ]
+        )
+
     def handle_switchbot_event(
         self, sender: Any, new_state: Optional[SwitchBotAdvertisement]
     ) -> None:
@@ -123,9 +175,13 @@ class AutomationHandler(BaseComponent[AutomationSettings]):
         asyncio.create_task(self._handle_event_async(raw_event))
 
     async def _handle_event_async(self, raw_event: RawStateEvent) -> None:
-        all_raw_events = await self._state_store.get_all()
         devices_config = self.settings.devices
-        snapshot = StateSnapshot(all_raw_events, devices_config)
+        # The snapshot only resolves configured device aliases, so copy just
+        # those entries rather than every entity seen so far
+        snapshot_raw_events = await self._state_store.get_many(
+            device.address for device in devices_config.values() if device.address
+        )
+        snapshot = StateSnapshot(snapshot_raw_events, devices_config)
 
         key = _get_key_from_raw_event(raw_event)
         previous_raw_event = await self._state_store.get_and_update(key, raw_event)
@@ -155,8 +211,11 @@ class AutomationHandler(BaseComponent[AutomationSettings]):
                 )
 
     async def _run_switchbot_runners(self, state: SwitchBotState) -> None:
+        runners = self._switchbot_runners_by_address.get(
+            state.id, self._unanchored_switchbot_runners
+        )
         results = await asyncio.gather(
-            *[runner.run(state) for runner in self._switchbot_runners],
+            *[runner.run(state) for runner in runners],
             return_exceptions=True,
         )
         self._process_runner_results(results)
@@ -12,6 +12,14 @@ from .config import MqttSettings
 logger = logging.getLogger(__name__)
 mqtt_message_received = signal("mqtt-message-received")
 
+# Built once and reused; the output is identical to json.dumps()
+_json_encoder = json.JSONEncoder()
+
+PUBLISH_QUEUE_MAXSIZE = 256
+PUBLISH_DRAIN_TIMEOUT = 5.0
+
+_PublishRequest = tuple[str, str, int, bool]
+
 
 class _NullClient:
     """A dummy client that does nothing. Used before the real client is started."""
@@ -31,6 +39,10 @@ class MqttClient(BaseComponent[MqttSettings]):
         self.client: Union[aiomqtt.Client, _NullClient] = _null_client
         self._stop_event = asyncio.Event()
         self._mqtt_loop_task: asyncio.Task | None = None
+        self._publish_queue: Optional[asyncio.Queue[_PublishRequest]] = None
+        self._publish_worker: asyncio.Task | None = None
+        # Puts that are waiting for room in a full queue
+        self._pending_puts: set[asyncio.Task] = set()
 
     def _is_enabled(self, settings: Optional[MqttSettings] = None) -> bool:
         """Checks if the component is enabled based on current or new settings."""
@@ -39,6 +51,7 @@ class MqttClient(BaseComponent[MqttSettings]):
 
     async def _start(self):
         logger.info("Starting MQTT client.")
+        self._stop_event.clear()
         # Replace the null client with the real one.
         self.client = aiomqtt.Client(
             hostname=self.settings.host,
@@ -75,6 +88,8 @@ class MqttClient(BaseComponent[MqttSettings]):
     async def _stop(self):
         logger.info("Stopping MQTT client.")
         self._stop_event.set()
+        # Flush queued messages while the connection is still up
+        await self._stop_publish_worker()
         if self._mqtt_loop_task and not self._mqtt_loop_task.done():
             self._mqtt_loop_task.cancel()
             try:
@@ -121,8 +136,118 @@ class MqttClient(BaseComponent[MqttSettings]):
         retain: bool = False,
     ):
         if isinstance(payload, (dict, list)):
-            payload = json.dumps(payload)
+            payload = _json_encoder.encode(payload)
+        if self.client is _null_client or self._stop_event.is_set():
+            # Not started yet, or stopping: nothing would drain a new queue
+            await _null_client.publish(topic, str(payload), qos=qos, retain=retain)
+            return
+        put = self._enqueue_publish((topic, str(payload), qos, retain))
+        if put is not None:
+            # Waits for room in the queue, but not for the broker. asyncio.wait()
+            # does not raise if stop() gives up on the message and cancels it.
+            await asyncio.wait({put})
+
+    def publish_nowait(
+        self,
+        topic: str,
+        payload: Union[str, Dict[str, Any], List[Any]],
+        qos: int = 0,
+        retain: bool = False,
+    ) -> None:
+        """
+        Queues a message without awaiting anything, for synchronous callers.
+        If the queue is full, a task waits for room instead of dropping the
+        message. Messages published before the client is started, or once it
+        is stopping, are ignored.
+        """
+        if self.client is _null_client or self._stop_event.is_set():
+            logger.debug("MQTT client is not connected. Publish request ignored.")
+            return
+        if isinstance(payload, (dict, list)):
+            payload = _json_encoder.encode(payload)
+        self._enqueue_publish((topic, str(payload), qos, retain))
+
+    def _enqueue_publish(self, request: _PublishRequest) -> Optional[asyncio.Task]:
+        """
+        Adds a message to the publish queue. If the queue is full, or earlier
+        messages are still waiting for room, returns the task that waits to
+        add it, so that messages keep their order.
+        """
+        queue = self._get_publish_queue()
+        if not self._pending_puts and not queue.full():
+            queue.put_nowait(request)
+            return None
+        task = asyncio.create_task(queue.put(request))
+        self._pending_puts.add(task)
+        task.add_done_callback(self._pending_puts.discard)
+        return task
+
+    def _get_publish_queue(self) -> asyncio.Queue[_PublishRequest]:
+        """
+        Returns the queue drained by the publish worker, starting the worker on
+        first use, so callers do not wait for the broker's acknowledgement.
+        """
+        if self._publish_queue is None:
+            self._publish_queue = asyncio.Queue(maxsize=PUBLISH_QUEUE_MAXSIZE)
+            self._publish_worker = asyncio.create_task(
+                self._run_publish_worker(self._publish_queue)
+            )
+        return self._publish_queue
+
+    async def _run_publish_worker(self, queue: asyncio.Queue[_PublishRequest]) -> None:
+        # One message at a time, so messages reach the broker in queue order
+        while True:
+            request = await queue.get()
+            try:
+                await self._publish_now(request)
+            except Exception:
+                logger.exception("Unexpected error while publishing a message.")
+            finally:
+                queue.task_done()
+
+    async def _publish_now(self, request: _PublishRequest) -> None:
+        topic, payload, qos, retain = request
         try:
-            await self.client.publish(topic, str(payload), qos=qos, retain=retain)
+            await self.client.publish(topic, payload, qos=qos, retain=retain)
         except aiomqtt.MqttError:
             logger.warning("MQTT client not connected, cannot publish message.")
+
+    async def wait_for_pending_publishes(self) -> None:
+        """Waits until every queued message has been handed to the broker."""
+        if self._publish_queue is not None:
+            await self._drain_publish_queue(self._publish_queue)
+
+    async def _drain_publish_queue(self, queue: asyncio.Queue[_PublishRequest]) -> None:
+        if self._pending_puts:
+            # Unlike gather(), wait() leaves the puts running if this is cancelled
+            await asyncio.wait(set(self._pending_puts))
+        await queue.join()
+
+    async def _stop_publish_worker(self) -> None:
+        """
+        Waits up to PUBLISH_DRAIN_TIMEOUT seconds for queued messages to be
+        published, then stops the worker.
+        """
+        queue = self._publish_queue
+        if queue is not None:
+            try:
+                await asyncio.wait_for(
+                    self._drain_publish_queue(queue), PUBLISH_DRAIN_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Timed out after {PUBLISH_DRAIN_TIMEOUT}s waiting for queued "
+                    f"MQTT messages; {queue.qsize() + len(self._pending_puts)} "
+                    "message(s) were not published."
+                )
+        for task in [*self._pending_puts, self._publish_worker]:
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(
+            *self._pending_puts,
+            *([self._publish_worker] if self._publish_worker else []),
+            return_exceptions=True,
+        )
+        self._pending_puts.clear()
+        self._publish_worker = None
+        self._publish_queue = None
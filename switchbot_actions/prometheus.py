@@ -1,8 +1,9 @@
 import logging
 from http.server import HTTPServer
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from prometheus_client import REGISTRY, Counter, Gauge, Summary, start_http_server
+from prometheus_client.registry import Collector
 
 from .component import BaseComponent
 from .config import DeviceSettings, PrometheusExporterSettings
@@ -70,12 +71,15 @@ class PrometheusExporter(BaseComponent[PrometheusExporterSettings]):
         if not isinstance(state, SwitchBotState):
             return
 
+        all_values = state.get_values_dict()
+        model = all_values.get("modelName", "Unknown")
+
         device_name = self._address_to_name_map.get(state.id)
         if device_name and self._info_gauge:
             info_labels = {
                 "address": state.id,
                 "name": device_name,
-                "model": state.get_values_dict().get("modelName", "Unknown"),
+                "model": model,
             }
             self._info_gauge.labels(**info_labels).set(1)
 
@@ -85,18 +89,17 @@ class PrometheusExporter(BaseComponent[PrometheusExporterSettings]):
 
         label_values = {
             "address": state.id,
-            "model": state.get_values_dict().get("modelName", "Unknown"),
+            "model": model,
         }
 
         if self._advertisements_counter:
             self._advertisements_counter.labels(**label_values).inc()
-        all_values = state.get_values_dict()
 
+        target_metrics = self.settings.target.get("metrics")
         for key, value in all_values.items():
             if not isinstance(value, (int, float, bool)):
                 continue
 
-            target_metrics = self.settings.target.get("metrics")
             if target_metrics and key not in target_metrics:
                 continue
 
@@ -224,6 +227,20 @@ class PrometheusExporter(BaseComponent[PrometheusExporterSettings]):
             registry=self.registry,
         )
 
+    def _owned_collectors(self) -> List[Collector]:
+        """Returns every collector this exporter has registered."""
+        collectors: List[Collector] = list(self._gauges.values())
+        for collector in (
+            self._info_gauge,
+            self._action_duration_summary,
+            self._scan_duration_summary,
+            self._cycle_duration_summary,
+            self._advertisements_counter,
+        ):
+            if collector:
+                collectors.append(collector)
+        return collectors
+
     async def _stop(self):
         """Stops the server and unregisters all gauges for a clean shutdown."""
         switchbot_advertisement_received.disconnect(self.handle_advertisement)
@@ -231,43 +248,22 @@ class PrometheusExporter(BaseComponent[PrometheusExporterSettings]):
         scan_executed.disconnect(self.handle_scan_execution)
         self.logger.info("PrometheusExporter disconnected from signals.")
 
-        all_gauges_to_unregister = list(self._gauges.values())
-        if self._info_gauge:
-            all_gauges_to_unregister.append(self._info_gauge)
-
-        for gauge in all_gauges_to_unregister:
+        for collector in self._owned_collectors():
             try:
-                self.registry.unregister(gauge)
+                self.registry.unregister(collector)
             except KeyError:
                 pass
         self._gauges.clear()
         self._info_gauge = None
-
-        if self._action_duration_summary:
-            try:
-                self.registry.unregister(self._action_duration_summary)
-            except KeyError:
-                pass
-            self._action_duration_summary = None
-
-        if self._scan_duration_summary:
-            try:
-                self.registry.unregister(self._scan_duration_summary)
-            except KeyError:
-                pass
-            self._scan_duration_summary = None
-
-        if self._advertisements_counter:
-            try:
-                self.registry.unregister(self._advertisements_counter)
-            except KeyError:
-                pass
-            self._advertisements_counter = None
+        self._action_duration_summary = None
+        self._scan_duration_summary = None
+        self._cycle_duration_summary = None
+        self._advertisements_counter = None
 
         self.logger.info("All Prometheus gauges have been unregistered.")
 
         if self.server:
-            if hasattr(self.server, "shutdown"):
+            if isinstance(self.server, HTTPServer):
                 self.server.shutdown()
             self.server = None
             self.logger.info("Prometheus exporter server stopped.")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import string
@@ -8,6 +9,7 @@ from typing import (
     Any,
     Dict,
     Generic,
+    Iterable,
     Mapping,
     Optional,
     Sequence,
@@ -28,6 +30,22 @@ logger = logging.getLogger(__name__)
 
 _empty_state_instance: "StateObject"
 
+# Sentinel for single-pass attribute lookups, distinguishing "missing" from None.
+_MISSING = object()
+
+
+def _is_template(value: str) -> bool:
+    """Returns True if the string contains placeholders to be rendered."""
+    return "{" in value or "}" in value
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_template(
+    template: str,
+) -> tuple[tuple[str, Optional[str], Optional[str], Optional[str]], ...]:
+    """Parses a template string once; repeated renders reuse the cached result."""
+    return tuple(string.Formatter().parse(template))
+
 
 class TemplateFormatter(string.Formatter):
     """
@@ -53,12 +71,16 @@ class TemplateFormatter(string.Formatter):
             return kwargs["previous"]
 
         # Priority 2: Trigger device's own keys
-        if current_data and hasattr(current_data, key):
-            return getattr(current_data, key)
+        if current_data:
+            value = getattr(current_data, key, _MISSING)
+            if value is not _MISSING:
+                return value
 
         # Priority 3: Device aliases from the snapshot
-        if snapshot and hasattr(snapshot, key):
-            return getattr(snapshot, key)
+        if snapshot:
+            value = getattr(snapshot, key, _MISSING)
+            if value is not _MISSING:
+                return value
 
         # Fallback for any other keys that might be in the context
         if key in kwargs:
@@ -66,6 +88,11 @@ class TemplateFormatter(string.Formatter):
 
         raise KeyError(key)
 
+    def parse(
+        self, format_string: str
+    ) -> Iterable[tuple[str, Optional[str], Optional[str], Optional[str]]]:
+        return _parse_template(format_string)
+
     def get_field(
         self, field_name: str, args: Sequence[Any], kwargs: Mapping[str, Any]
     ) -> tuple[Any, str]:
@@ -115,6 +142,9 @@ class StateSnapshot:
 
 
 class StateObject(ABC, Generic[T_State]):
+    # One instance is created per received event, so avoid a per-instance __dict__
+    __slots__ = ("_raw_event", "_cached_values", "previous", "snapshot")
+
     def __init__(
         self,
         raw_event: T_State,
@@ -122,7 +152,7 @@ class StateObject(ABC, Generic[T_State]):
         snapshot: Optional[StateSnapshot] = None,
     ):
         self._raw_event = raw_event
-        self._cached_values = None
+        self._cached_values: Optional[Dict[str, Any]] = None
         self.previous = previous if previous else _empty_state_instance
         self.snapshot = snapshot
 
@@ -163,18 +193,22 @@ class StateObject(ABC, Generic[T_State]):
     def format(
         self, template_data: Union[str, Dict[str, Any], list[Any]]
     ) -> Union[str, Dict[str, Any], list[Any]]:
-        context = {
-            "__current_data__": self,
-            "previous": self.previous,
-            "snapshot": self.snapshot,
-        }
         if isinstance(template_data, dict):
             return {k: self.format(v) for k, v in template_data.items()}
         elif isinstance(template_data, list):
             return [self.format(item) for item in template_data]
         elif isinstance(template_data, str):
+            if not _is_template(template_data):
+                # Nothing to substitute; skip the formatter entirely
+                return template_data
+            context = {
+                "__current_data__": self,
+                "previous": self.previous,
+                "snapshot": self.snapshot,
+            }
             try:
-                return _template_formatter.format(template_data, **context)
+                # vformat takes the context mapping as-is, without a **kwargs copy
+                return _template_formatter.vformat(template_data, (), context)
             except AttributeError as e:
                 raise ValueError(f"Invalid attribute access in placeholder: {e}") from e
             except KeyError as e:
@@ -190,6 +224,8 @@ class StateObject(ABC, Generic[T_State]):
 class _NullState(StateObject):
     """A placeholder for a non-existent state, returning itself on attr access."""
 
+    __slots__ = ()
+
     def __init__(self):
         # Note: No call to super().__init__ is needed here as we are overriding
         # all necessary attributes and methods.
@@ -224,6 +260,8 @@ _empty_state_instance = _NullState()
 
 
 class SwitchBotState(StateObject[SwitchBotAdvertisement]):
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         return self._raw_event.address
@@ -242,6 +280,8 @@ class SwitchBotState(StateObject[SwitchBotAdvertisement]):
 
 
 class MqttState(StateObject[aiomqtt.Message]):
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         return str(self._raw_event.topic)
@@ -254,6 +294,10 @@ class MqttState(StateObject[aiomqtt.Message]):
             payload_decoded = str(state.payload)
 
         format_data = {"topic": str(state.topic), "payload": payload_decoded}
+        # Only JSON objects are merged, so skip the parser for plain-text
+        # payloads such as "ON" or "23.5"
+        if payload_decoded.lstrip()[:1] != "{":
+            return format_data
         try:
             payload_json = json.loads(payload_decoded)
             if isinstance(payload_json, dict):
@@ -1,7 +1,7 @@
 # switchbot_actions/store.py
 import logging
 from asyncio import Lock
-from typing import TypeAlias, Union
+from typing import Iterable, TypeAlias, Union
 
 import aiomqtt
 from switchbot import SwitchBotAdvertisement
@@ -49,3 +49,12 @@ class StateStore:
         """
         async with self._lock:
             return self._states.copy()
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, RawStateEvent]:
+        """
+        Retrieves a copy of the raw events for the given keys only.
+        Keys with no associated state are omitted.
+        """
+        async with self._lock:
+            states = self._states
+            return {key: states[key] for key in keys if key in states}
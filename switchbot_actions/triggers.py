@@ -1,11 +1,13 @@
 import asyncio
+import functools
 import logging
 import operator
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Generic, TypeVar, cast
 
 from .config import AutomationIf
-from .state import StateObject
+from .state import _MISSING, StateObject, _is_template
 from .timers import Timer
 
 logger = logging.getLogger("switchbot_actions.automation")
@@ -20,32 +22,87 @@ OPERATORS = {
 }
 
 
-def _evaluate_single_condition(condition: str, new_value: Any) -> bool:
-    """Evaluates a single state condition."""
-    parts = str(condition).split(" ", 1)
-    op_str = "=="
-    val_str = str(condition)
+def _parse_number(val_str: str) -> float | None:
+    """Parses an operand string as a float, or returns None if it is not numeric."""
+    try:
+        return float(val_str)
+    except ValueError:
+        return None
+
+
+# Operator function, operand string and operand pre-parsed as a float
+_CompiledCondition = tuple[Callable[[Any, Any], bool], str, float | None]
+# Condition key, alias, attribute name, value template and compiled comparison
+_PreparedCondition = tuple[str, str | None, str, str, _CompiledCondition | None]
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_condition(condition: str) -> _CompiledCondition:
+    """
+    Splits a condition string into its operator function, operand string
+    (interned) and the operand pre-parsed as a float (None if it is not numeric).
+    The result is cached, so each distinct condition string is parsed only once.
+    """
+    op_str, sep, val_str = condition.partition(" ")
+    op = OPERATORS.get(op_str)
+    if not (sep and op is not None):
+        # No recognized operator: implicit equality against the whole string
+        op, val_str = operator.eq, condition
+    return op, sys.intern(val_str), _parse_number(val_str)
 
-    if len(parts) == 2 and parts[0] in OPERATORS:
-        op_str = parts[0]
-        val_str = parts[1]
 
-    op = OPERATORS.get(op_str, operator.eq)
+@functools.lru_cache(maxsize=1024)
+def _coerce_operand(val_str: str, value_type: type) -> Any:
+    """Converts an operand string to the type of the value being compared."""
+    return value_type(val_str)
+
+
+def _evaluate_compiled_condition(compiled: _CompiledCondition, new_value: Any) -> bool:
+    """Evaluates a condition already split by _compile_condition."""
+    op, val_str, number = compiled
 
     try:
         if new_value is None:
             return False
-        if isinstance(new_value, bool):
+        value_type = type(new_value)
+        if value_type is float:
+            # Most sensor readings are floats; compare against the pre-parsed operand
+            if number is None:
+                return False
+            expected_value = number
+        elif isinstance(new_value, bool):
             expected_value = val_str.lower() in ("true", "1", "t", "y", "yes")
         elif isinstance(new_value, str):
             expected_value = val_str
         else:
-            expected_value = type(new_value)(val_str)
+            expected_value = _coerce_operand(val_str, value_type)
         return op(new_value, expected_value)
     except (ValueError, TypeError):
         return False
 
 
+def _evaluate_single_condition(condition: str, new_value: Any) -> bool:
+    """Evaluates a single state condition."""
+    return _evaluate_compiled_condition(_compile_condition(str(condition)), new_value)
+
+
+def _condition_evaluation_cost(prepared: _PreparedCondition) -> int:
+    """
+    Ranks a prepared condition by how much work it takes to evaluate.
+    The address of the triggering device is cheapest, then its other
+    attributes, 'previous.*' references and cross-device aliases, which need
+    a snapshot lookup. Values with placeholders are rendered for every event.
+    """
+    key, alias, _, _, compiled = prepared
+    if alias is None:
+        cost = 0 if key == "address" else 1
+    else:
+        cost = 2 if alias == "previous" else 3
+    if compiled is None:
+        cost += 4
+    return cost
+
+
 T = TypeVar("T", bound=StateObject)
 
 
@@ -53,25 +110,53 @@ class Trigger(ABC, Generic[T]):
     def __init__(self, if_config: AutomationIf):
         self._if_config = if_config
         self._action: Callable[[T], Any] | None = None
+        self._prepared_from: Any = None
+        self._prepared_conditions: tuple[_PreparedCondition, ...] = ()
 
     def on_triggered(self, action: Callable[[T], Any]):
         self._action = action
 
+    @staticmethod
+    def _prepare_conditions(
+        conditions: dict[str, Any],
+    ) -> tuple[_PreparedCondition, ...]:
+        """
+        Resolves each condition once into (key, alias, attribute, template,
+        compiled), so per-event checks need no key splitting. 'compiled' is
+        None when the condition value contains placeholders and has to be
+        formatted against each event.
+        Conditions are ANDed, so the result is ordered cheapest first; the
+        configured conditions themselves keep the user's order.
+        """
+        prepared = []
+        for key, condition_value in conditions.items():
+            alias: str | None = None
+            attr_name = key
+            if "." in key:
+                alias, attr_name = key.split(".", 1)
+            template = str(condition_value)
+            compiled = None if _is_template(template) else _compile_condition(template)
+            prepared.append((key, alias, attr_name, template, compiled))
+        return tuple(sorted(prepared, key=_condition_evaluation_cost))
+
     def _check_all_conditions(self, state: T) -> bool:
         """
         Checks if the given conditions are met by the current state.
         Returns True if all conditions are met, False if any condition is not met,
         and None if the state does not match the expected source or topic.
         """
-        for key, condition_value in self._if_config.conditions.items():
+        conditions = self._if_config.conditions
+        if conditions is not self._prepared_from:
+            # Prepared on first use, and again if the conditions are replaced
+            self._prepared_conditions = self._prepare_conditions(conditions)
+            self._prepared_from = conditions
+
+        for key, alias, attr_name, template, compiled in self._prepared_conditions:
             target_state = state
-            attr_name = key
 
-            if "." in key:
+            if alias is not None:
                 # Cross-device state reference, e.g., "living_meter.temperature"
                 # or "previous.temperature"
-                alias, attr_name = key.split(".", 1)
-
                 if alias == "previous":
                     target_state = state.previous
                 else:
@@ -92,8 +177,9 @@ class Trigger(ABC, Generic[T]):
                         # No error log, just silently treat as condition not met
                         return False
 
-            if not hasattr(target_state, attr_name):
-                if "." in key:
+            value_to_check = getattr(target_state, attr_name, _MISSING)
+            if value_to_check is _MISSING:
+                if alias is not None:
                     # Alias is valid, but attribute does not exist on the device state
                     logger.error(
                         f"Rule '{self._if_config.name}': Device does not have "
@@ -101,14 +187,12 @@ class Trigger(ABC, Generic[T]):
                         "Please check your configuration."
                     )
                 return False
-            value_to_check = getattr(target_state, attr_name)
 
-            # Format the condition value string (RHS) using the current state
-            formatted_condition_value = state.format(str(condition_value))
+            if compiled is None:
+                # Format the condition value string (RHS) using the current state
+                compiled = _compile_condition(state.format(template))
 
-            if not _evaluate_single_condition(
-                formatted_condition_value, value_to_check
-            ):
+            if not _evaluate_compiled_condition(compiled, value_to_check):
                 return False
 
         return True
@@ -142,7 +226,6 @@ class DurationTrigger(Trigger[T]):
         self._rule_conditions_met: dict[str, bool] = {}
 
     async def process_state(self, state: T) -> None:
-        name = self._if_config.name
         conditions_now_met = self._check_all_conditions(state)
 
         if conditions_now_met is None:
@@ -153,6 +236,9 @@ class DurationTrigger(Trigger[T]):
         if conditions_now_met and not rule_conditions_previously_met:
             # Conditions just became true, start timer
             self._rule_conditions_met[state.id] = True
+            # The rule name is a pydantic private attribute, which is slow to
+            # read, so it is only looked up when a timer actually changes
+            name = self._if_config.name
             duration = self._if_config.duration
 
             assert duration is not None, "Duration must be set for timer-based rules"
@@ -175,7 +261,9 @@ class DurationTrigger(Trigger[T]):
             if state.id in self._active_timers:
                 self._active_timers[state.id].stop()
                 del self._active_timers[state.id]
-                logger.debug(f"Timer cancelled for rule '{name}' on {state.id}.")
+                logger.debug(
+                    f"Timer cancelled for rule '{self._if_config.name}' on {state.id}."
+                )
 
     async def _timer_callback(self, state: T) -> None:
         """Called when the timer completes."""
@@ -1,13 +1,16 @@
-from unittest.mock import MagicMock
-
 import aiomqtt
 import pytest
 from switchbot import SwitchBotAdvertisement
 
+from switchbot_actions.state import create_state_object
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_switchbot_advertisement():
-    """A factory for creating mock SwitchBotAdvertisement objects."""
+    """A factory for creating mock SwitchBotAdvertisement objects.
+
+    The factory holds no state, so it is shared across the whole session.
+    """
 
     def _factory(**kwargs):
         default_data = {
@@ -17,7 +20,7 @@ def mock_switchbot_advertisement():
                 "modelName": "WoSensorTH",
             },
             "rssi": -50,
-            "device": MagicMock(),
+            "device": None,  # No test inspects the BLE device
         }
         default_data.update(kwargs)
         return SwitchBotAdvertisement(**default_data)
@@ -25,7 +28,7 @@ def mock_switchbot_advertisement():
     return _factory
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mqtt_message_plain() -> aiomqtt.Message:
     """A sample aiomqtt.Message object with plain text payload."""
     message = aiomqtt.Message(
@@ -39,7 +42,7 @@ def mqtt_message_plain() -> aiomqtt.Message:
     return message
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mqtt_message_json() -> aiomqtt.Message:
     """A sample aiomqtt.Message object with JSON payload."""
     message = aiomqtt.Message(
@@ -53,17 +56,19 @@ def mqtt_message_json() -> aiomqtt.Message:
     return message
 
 
-@pytest.fixture
-def sample_state(mock_switchbot_advertisement):
-    """A sample StateObject (SwitchBotState) for testing purposes."""
-    raw_state = mock_switchbot_advertisement(
+@pytest.fixture(scope="module")
+def sample_state():
+    """A sample StateObject (SwitchBotState) for testing purposes.
+
+    Module-scoped; tests that mutate the state should use a copy.
+    """
+    raw_state = SwitchBotAdvertisement(
         address="e1:22:33:44:55:66",
         data={
             "data": {"temperature": 25.0, "humidity": 50, "battery": 100},
             "modelName": "WoSensorTH",
         },
         rssi=-50,
+        device=None,  # type: ignore[arg-type]
     )
-    from switchbot_actions.state import create_state_object
-
     return create_state_object(raw_state)
@@ -2,6 +2,7 @@ import asyncio
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from switchbot import Switchbot, SwitchbotModel
 
@@ -262,9 +263,7 @@ async def test_webhook_send_request_post_success(mock_async_client, caplog):
     caplog.set_level(logging.DEBUG)
     mock_response = AsyncMock()
     mock_response.status_code = 200
-    mock_async_client.return_value.__aenter__.return_value.post.return_value = (
-        mock_response
-    )
+    mock_async_client.return_value.post = AsyncMock(return_value=mock_response)
 
     executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
     await executor._send_request(
@@ -281,16 +280,14 @@ async def test_webhook_send_request_post_with_list_payload(mock_async_client, ca
     caplog.set_level(logging.DEBUG)
     mock_response = AsyncMock()
     mock_response.status_code = 200
-    mock_async_client.return_value.__aenter__.return_value.post.return_value = (
-        mock_response
-    )
+    mock_async_client.return_value.post = AsyncMock(return_value=mock_response)
 
     executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
     list_payload = ["item1", "item2"]
     await executor._send_request("http://test.com", "POST", list_payload, {})
 
     # Verify that post was called with json parameter for list payload
-    mock_client = mock_async_client.return_value.__aenter__.return_value
+    mock_client = mock_async_client.return_value
     mock_client.post.assert_called_once_with(
         "http://test.com", json=list_payload, headers={}, timeout=10
     )
@@ -306,16 +303,14 @@ async def test_webhook_send_request_post_with_raw_string_payload(
     caplog.set_level(logging.DEBUG)
     mock_response = AsyncMock()
     mock_response.status_code = 200
-    mock_async_client.return_value.__aenter__.return_value.post.return_value = (
-        mock_response
-    )
+    mock_async_client.return_value.post = AsyncMock(return_value=mock_response)
 
     executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
     raw_payload = "raw_string_data"
     await executor._send_request("http://test.com", "POST", raw_payload, {})
 
     # Verify that post was called with content parameter for string payload
-    mock_client = mock_async_client.return_value.__aenter__.return_value
+    mock_client = mock_async_client.return_value
     mock_client.post.assert_called_once_with(
         "http://test.com",
         content=raw_payload,
@@ -332,9 +327,7 @@ async def test_webhook_send_request_get_failure(mock_async_client, caplog):
     mock_response = AsyncMock()
     mock_response.status_code = 500
     mock_response.text = "Server Error"
-    mock_async_client.return_value.__aenter__.return_value.get.return_value = (
-        mock_response
-    )
+    mock_async_client.return_value.get = AsyncMock(return_value=mock_response)
 
     executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
     await executor._send_request("http://test.com", "GET", {"p": "v"}, {"h": "v"})
@@ -342,6 +335,40 @@ async def test_webhook_send_request_get_failure(mock_async_client, caplog):
     assert "Webhook to http://test.com failed with status 500" in caplog.text
 
 
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient")
+async def test_webhook_send_request_reuses_client(mock_async_client):
+    """Test that consecutive webhooks share one pooled HTTP client."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_async_client.return_value.post = AsyncMock(return_value=mock_response)
+
+    executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
+    await executor._send_request("http://test.com", "POST", {"n": 1}, {})
+    await executor._send_request("http://test.com", "POST", {"n": 2}, {})
+
+    mock_async_client.assert_called_once()
+    assert mock_async_client.return_value.post.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient")
+async def test_webhook_executor_close_closes_client(mock_async_client):
+    """Test that closing the executor closes its pooled HTTP client once."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_async_client.return_value.post = AsyncMock(return_value=mock_response)
+    mock_async_client.return_value.aclose = AsyncMock()
+
+    executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
+    await executor.close()  # No client yet, nothing to close
+    await executor._send_request("http://test.com", "POST", {"n": 1}, {})
+    await executor.close()
+    await executor.close()
+
+    mock_async_client.return_value.aclose.assert_awaited_once_with()
+
+
 @pytest.mark.asyncio
 async def test_webhook_send_request_unsupported_method(caplog):
     caplog.set_level(logging.ERROR)
@@ -635,3 +662,69 @@ def test_create_action_executor_raises_error_for_unknown_type():
     mock_action.type = "unknown"
     with pytest.raises(ValueError, match="Unknown action type: unknown"):
         create_action_executor(mock_action, MagicMock(spec=StateStore))
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient")
+async def test_webhook_send_request_after_close_uses_one_off_client(
+    mock_async_client,
+):
+    """Test that a send after close does not leave a new pooled client behind."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    one_off_client = mock_async_client.return_value.__aenter__.return_value
+    one_off_client.post = AsyncMock(return_value=mock_response)
+
+    executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
+    await executor.close()
+    await executor._send_request("http://test.com", "POST", {"n": 1}, {})
+
+    one_off_client.post.assert_awaited_once()
+    mock_async_client.return_value.__aexit__.assert_awaited_once()
+    assert executor._client is None
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient")
+async def test_webhook_executor_close_waits_for_in_flight_request(mock_async_client):
+    """Test that close() does not close the client under a running request."""
+    responded = asyncio.Event()
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+
+    async def slow_post(*args, **kwargs):
+        await responded.wait()
+        return mock_response
+
+    mock_client = mock_async_client.return_value
+    mock_client.post = AsyncMock(side_effect=slow_post)
+    mock_client.aclose = AsyncMock()
+
+    executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
+    request = asyncio.create_task(
+        executor._send_request("http://test.com", "POST", {"n": 1}, {})
+    )
+    await asyncio.sleep(0)
+    await executor.close()
+    mock_client.aclose.assert_not_awaited()
+
+    responded.set()
+    await request
+    mock_client.aclose.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_webhook_client_does_not_keep_response_cookies():
+    """Test that a Set-Cookie from one webhook is not sent with the next one."""
+    executor = WebhookExecutor(WebhookAction(type="webhook", url="http://test.com"))
+    client = executor._get_client()
+    response = httpx.Response(
+        200,
+        headers={"set-cookie": "session=abc; Path=/"},
+        request=httpx.Request("POST", "http://test.com"),
+    )
+
+    client.cookies.extract_cookies(response)
+
+    assert not client.cookies
+    await executor.close()
@@ -70,3 +70,21 @@ class TestActionRunner:
 
         await runner.run(state_object)
         trigger.process_state.assert_called_once_with(state_object)
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_executors(self):
+        config = AutomationRule.model_validate(
+            {
+                "name": "Test Rule",
+                "if": {"source": "switchbot"},
+                "then": [{"type": "shell_command", "command": ["echo", "test"]}],
+            }
+        )
+        mock_executors = [AsyncMock(), AsyncMock()]
+        trigger = MagicMock(spec=EdgeTrigger)
+        runner = ActionRunner(config, executors=mock_executors, trigger=trigger)
+
+        await runner.close()
+
+        for mock_executor in mock_executors:
+            mock_executor.close.assert_awaited_once_with()
@@ -308,3 +308,51 @@ async def test_run_app_handles_os_error_on_startup(
         assert "Address already in use" in caplog.text
         mock_exit.assert_called_once_with(1)
         mock_app.return_value.stop.assert_not_called()
+
+
+# Publish Request Tests
+
+
+@pytest.mark.asyncio
+async def test_publish_request_is_queued_without_a_task(
+    app_with_mocked_abstract_methods,
+):
+    """Test that a publish request outside a reload is queued synchronously."""
+    app = app_with_mocked_abstract_methods
+    mqtt_component = app._components["mqtt"]
+
+    with (
+        patch.object(mqtt_component, "publish_nowait") as mock_publish_nowait,
+        patch("switchbot_actions.app.asyncio.create_task") as mock_create_task,
+    ):
+        app._handle_publish_request(None, "test/topic", "payload", 1, True)
+
+    mock_publish_nowait.assert_called_once_with(
+        topic="test/topic", payload="payload", qos=1, retain=True
+    )
+    mock_create_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_publish_request_during_reload_waits_in_tracked_task(
+    app_with_mocked_abstract_methods,
+):
+    """Test that a publish request during a reload is deferred to a kept task."""
+    app = app_with_mocked_abstract_methods
+    mqtt_component = app._components["mqtt"]
+    app.is_reloading = True
+
+    with patch.object(
+        mqtt_component, "publish", new_callable=AsyncMock
+    ) as mock_publish:
+        app._handle_publish_request(None, "test/topic", "payload", 0, False)
+        assert len(app._background_tasks) == 1
+        (task,) = app._background_tasks
+
+        app.is_reloading = False
+        await task
+
+    mock_publish.assert_awaited_once_with(
+        topic="test/topic", payload="payload", qos=0, retain=False
+    )
+    assert not app._background_tasks
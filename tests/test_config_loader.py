@@ -5,25 +5,52 @@ import pytest
 from pydantic import ValidationError
 from ruamel.yaml.error import YAMLError
 
+from switchbot_actions.config import AppSettings
 from switchbot_actions.config_loader import load_settings_from_cli
 from switchbot_actions.error import ConfigError
 
 
-@patch(
-    "switchbot_actions.config_loader.format_validation_error",
-    return_value="Mocked Validation Error Output",
-)
-def test_load_settings_from_cli_invalid_config_missing_field(
-    mock_format_validation_error, tmp_path
-):
-    """Test that load_settings_from_cli handles a missing field error and exits."""
-    invalid_config_content = """
+@pytest.mark.parametrize(
+    "invalid_config_content",
+    [
+        pytest.param(
+            """
 automations:
   - name: "Turn off Lights if No Motion for 3 Minutes"
     then:
       - type: shell_command
         command: "echo 'hello'"
-"""
+""",
+            id="missing_field",
+        ),
+        pytest.param(
+            """
+    logging:
+      level: "DETAIL"
+      format: "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    """,
+            id="enum",
+        ),
+        pytest.param(
+            """
+    automations:
+      - if:
+          source: mqtt
+        then:
+          type: mqtt-publish
+    """,
+            id="tag",
+        ),
+    ],
+)
+@patch(
+    "switchbot_actions.config_loader.format_validation_error",
+    return_value="Mocked Validation Error Output",
+)
+def test_load_settings_from_cli_invalid_config(
+    mock_format_validation_error, invalid_config_content, tmp_path
+):
+    """Test that load_settings_from_cli reports validation errors as ConfigError."""
     config_file = tmp_path / "invalid_config.yaml"
     config_file.write_text(invalid_config_content)
 
@@ -36,10 +63,9 @@ automations:
     assert str(e.value) == "Mocked Validation Error Output"
     mock_format_validation_error.assert_called_once()
     args, kwargs = mock_format_validation_error.call_args
-    assert isinstance(args[0], ValidationError)  # Check if it's a
-    # ValidationError instance
+    assert isinstance(args[0], ValidationError)
     assert args[1] == config_file
-    assert isinstance(args[2], dict)  # Check if it's the config_data
+    assert isinstance(args[2], dict)
 
 
 def test_load_settings_from_cli_overrides_config_with_cli_args(tmp_path):
@@ -103,34 +129,15 @@ def test_load_settings_from_cli_overrides_config_with_cli_args(tmp_path):
     assert settings.prometheus.port == 9000
 
 
-@patch(
-    "switchbot_actions.config_loader.format_validation_error",
-    return_value="Mocked Enum Validation Error Output",
-)
-def test_load_settings_from_cli_invalid_config_enum(
-    mock_format_validation_error, tmp_path
-):
-    """Test that load_settings_from_cli handles an enum error and exits."""
-    invalid_config_content = """
-    logging:
-      level: "DETAIL"
-      format: "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    """
-    config_file = tmp_path / "invalid_config.yaml"
-    config_file.write_text(invalid_config_content)
-
-    # Create a mock args object
-    mock_args = argparse.Namespace(config=str(config_file))
+def test_load_settings_from_cli_missing_file_uses_defaults(tmp_path, capsys):
+    """Test that a missing config file falls back to default settings."""
+    config_file = tmp_path / "missing.yaml"
+    mock_args = argparse.Namespace(config=str(config_file), verbose=0)
 
-    with pytest.raises(ConfigError) as e:
-        load_settings_from_cli(mock_args)
+    settings = load_settings_from_cli(mock_args)
 
-    assert str(e.value) == "Mocked Enum Validation Error Output"
-    mock_format_validation_error.assert_called_once()
-    args, kwargs = mock_format_validation_error.call_args
-    assert isinstance(args[0], ValidationError)
-    assert args[1] == config_file
-    assert isinstance(args[2], dict)
+    assert settings == AppSettings.model_validate({})
+    assert f"Configuration file not found at {config_file}" in capsys.readouterr().err
 
 
 def test_load_settings_from_cli_yaml_syntax_error(tmp_path):
@@ -215,9 +222,7 @@ def test_prometheus_precedence(tmp_path):
     assert settings_3.prometheus.enabled is False
 
 
-@patch(
-    "switchbot_actions.config_loader.YAML",
-)
+@patch("switchbot_actions.config_loader._yaml_loader")
 def test_load_settings_from_cli_yaml_syntax_error_no_problem_mark(
     mock_yaml_loader, tmp_path
 ):
@@ -230,8 +235,7 @@ def test_load_settings_from_cli_yaml_syntax_error_no_problem_mark(
     config_file.write_text("dummy_content")
 
     # Mock the YAML loader to raise a YAMLError without problem_mark
-    mock_yaml_instance = mock_yaml_loader.return_value
-    mock_yaml_instance.load.side_effect = YAMLError("Generic YAML Error")
+    mock_yaml_loader.load.side_effect = YAMLError("Generic YAML Error")
 
     mock_args = argparse.Namespace(config=str(config_file))
 
@@ -242,41 +246,6 @@ def test_load_settings_from_cli_yaml_syntax_error_no_problem_mark(
     assert ">" not in str(e.value)  # No code snippet expected
 
 
-@patch(
-    "switchbot_actions.config_loader.format_validation_error",
-    return_value="Mocked Tag Validation Error Output",
-)
-def test_load_settings_from_cli_invalid_config_tag(
-    mock_format_validation_error, tmp_path
-):
-    """
-    Test that load_settings_from_cli handles a missing required field
-    for a specific tag.
-    """
-    invalid_config_content = """
-    automations:
-      - if:
-          source: mqtt
-        then:
-          type: mqtt-publish
-    """
-    config_file = tmp_path / "invalid_config.yaml"
-    config_file.write_text(invalid_config_content)
-
-    # Create a mock args object
-    mock_args = argparse.Namespace(config=str(config_file))
-
-    with pytest.raises(ConfigError) as e:
-        load_settings_from_cli(mock_args)
-
-    assert str(e.value) == "Mocked Tag Validation Error Output"
-    mock_format_validation_error.assert_called_once()
-    args, kwargs = mock_format_validation_error.call_args
-    assert isinstance(args[0], ValidationError)
-    assert args[1] == config_file
-    assert isinstance(args[2], dict)
-
-
 def test_load_settings_from_cli_verbose_overrides_logging_settings(tmp_path):
     """Test that verbose CLI arguments correctly override logging settings."""
     config_content = """
@@ -1,4 +1,5 @@
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -165,26 +166,17 @@ def test_format_validation_error_multiple_errors(tmp_path):
         {
             "type": "missing",
             "loc": ("key1",),
-            "input": MagicMock(lc=MockMark(line=0, col=0)),
+            "input": SimpleNamespace(lc=MockMark(line=0, col=0)),
             "msg": "Field required",
         },
         {
             "type": "value_error",
             "loc": ("key2",),
-            "input": MagicMock(lc=MockMark(line=1, col=0)),
+            "input": SimpleNamespace(lc=MockMark(line=1, col=0)),
             "msg": "Invalid value",
         },
     ]
 
-    # Mock CommentedMap to have lc attribute
-    mock_commented_map_key1 = MagicMock()
-    mock_commented_map_key1.lc.line = 0
-    mock_commented_map_key1.lc.col = 0
-
-    mock_commented_map_key2 = MagicMock()
-    mock_commented_map_key2.lc.line = 1
-    mock_commented_map_key2.lc.col = 0
-
     with patch(
         "switchbot_actions.error.get_error_snippet",
         side_effect=lambda *args, **kwargs: "SNIPPET",
@@ -22,7 +22,7 @@ def state_store():
     mock_store = AsyncMock(spec=StateStore)
     mock_store.get.return_value = None  # Default for build_state_with_previous
     mock_store.get_and_update.return_value = None  # Ensure previous_raw_event is None
-    mock_store.get_all = AsyncMock(return_value={})  # Mock get_all method
+    mock_store.get_many = AsyncMock(return_value={})  # Mock get_many method
     return mock_store
 
 
@@ -105,19 +105,26 @@ async def test_handle_switchbot_event_schedules_runner_task(
     # Ensure get_and_update returns None to prevent TypeError
     handler._state_store.get_and_update.return_value = None
 
-    # Mock the internal async method that gets called by create_task
-    handler._run_switchbot_runners = AsyncMock()
+    # Record the state passed to the internal async method
+    received_states = []
+    handled = asyncio.Event()
+
+    async def record_runners(state):
+        received_states.append(state)
+        handled.set()
+
+    handler._run_switchbot_runners = record_runners
 
     raw_state = mock_switchbot_advertisement(address="test_address")
     handler.handle_switchbot_event(None, new_state=raw_state)
 
-    # Allow the scheduled task to run
-    await asyncio.sleep(0)
+    # Wait for the scheduled task to reach the runners
+    await asyncio.wait_for(handled.wait(), timeout=1)
 
     # Assert that the internal method was called with the correct state object
     expected_state_object = create_state_object(raw_state, previous=None)
-    handler._run_switchbot_runners.assert_awaited_once()
-    actual_state_object = handler._run_switchbot_runners.call_args[0][0]
+    assert len(received_states) == 1
+    actual_state_object = received_states[0]
     assert (
         actual_state_object.get_values_dict() == expected_state_object.get_values_dict()
     )
@@ -144,19 +151,26 @@ async def test_handle_mqtt_message_schedules_runner_task(
     # Ensure get_and_update returns None to prevent TypeError
     handler._state_store.get_and_update.return_value = None
 
-    # Mock the internal async method that gets called by create_task
-    handler._run_mqtt_runners = AsyncMock()
+    # Record the state passed to the internal async method
+    received_states = []
+    handled = asyncio.Event()
+
+    async def record_runners(state):
+        received_states.append(state)
+        handled.set()
+
+    handler._run_mqtt_runners = record_runners
 
     raw_message = mqtt_message_plain
     handler.handle_mqtt_event(None, message=raw_message)
 
-    # Allow the scheduled task to run
-    await asyncio.sleep(0)
+    # Wait for the scheduled task to reach the runners
+    await asyncio.wait_for(handled.wait(), timeout=1)
 
     # Assert that the internal method was called with the correct state object
     expected_state_object = create_state_object(raw_message, previous=None)
-    handler._run_mqtt_runners.assert_awaited_once()
-    actual_state_object = handler._run_mqtt_runners.call_args[0][0]
+    assert len(received_states) == 1
+    actual_state_object = received_states[0]
     assert (
         actual_state_object.get_values_dict() == expected_state_object.get_values_dict()
     )
@@ -256,6 +270,27 @@ async def test_automation_handler_lifecycle_connects_and_disconnects_signals(
         mock_mqtt_signal.connect.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_stop_closes_action_runners(automation_handler_factory):
+    """Test that stopping the handler releases the runners' executors."""
+    configs = [
+        AutomationRule.model_validate({"if": {"source": "switchbot"}, "then": []}),
+        AutomationRule.model_validate(
+            {"if": {"source": "mqtt", "topic": "#"}, "then": []}
+        ),
+    ]
+    handler = automation_handler_factory(AutomationSettings(rules=configs))
+    runners = [*handler._switchbot_runners, *handler._mqtt_runners]
+
+    await handler.start()
+    with patch(
+        "switchbot_actions.handlers.ActionRunner.close", autospec=True
+    ) as mock_close:
+        await handler.stop()
+
+    assert [call.args[0] for call in mock_close.await_args_list] == runners
+
+
 @pytest.mark.asyncio
 async def test_run_switchbot_runners_concurrently(
     automation_handler_factory, mock_switchbot_advertisement, state_store
@@ -285,6 +320,52 @@ async def test_run_switchbot_runners_concurrently(
     mock_run_2.assert_awaited_once_with(state_object)
 
 
+@pytest.mark.asyncio
+async def test_run_switchbot_runners_only_runs_rules_for_matching_address(
+    automation_handler_factory, mock_switchbot_advertisement, state_store
+):
+    """
+    Test that rules pinned to an address are skipped for other devices, while
+    unpinned rules still run for every advertisement.
+    """
+    configs = [
+        AutomationRule.model_validate(
+            {
+                "if": {"source": "switchbot", "conditions": {"address": addr}},
+                "then": [],
+            }
+        )
+        for addr in ["AA:AA:AA:AA:AA:AA", "== BB:BB:BB:BB:BB:BB"]
+    ]
+    configs.append(
+        AutomationRule.model_validate({"if": {"source": "switchbot"}, "then": []})
+    )
+    settings = AutomationSettings(rules=configs)
+    handler = automation_handler_factory(settings)
+
+    mock_runs = [AsyncMock() for _ in handler._switchbot_runners]
+    for runner, mock_run in zip(handler._switchbot_runners, mock_runs):
+        runner.run = mock_run
+
+    state_object = create_state_object(
+        mock_switchbot_advertisement(address="BB:BB:BB:BB:BB:BB")
+    )
+    await handler._run_switchbot_runners(state_object)
+
+    mock_runs[0].assert_not_awaited()
+    mock_runs[1].assert_awaited_once_with(state_object)
+    mock_runs[2].assert_awaited_once_with(state_object)
+
+    unknown_state_object = create_state_object(
+        mock_switchbot_advertisement(address="CC:CC:CC:CC:CC:CC")
+    )
+    await handler._run_switchbot_runners(unknown_state_object)
+
+    mock_runs[0].assert_not_awaited()
+    mock_runs[1].assert_awaited_once()
+    mock_runs[2].assert_awaited_with(unknown_state_object)
+
+
 @pytest.mark.asyncio
 async def test_run_mqtt_runners_concurrently(
     automation_handler_factory, mqtt_message_plain, state_store
@@ -477,6 +558,7 @@ async def test_apply_live_update_reinitializes_runners(automation_handler_factor
         ),
     ]
     new_settings = AutomationSettings(rules=new_rules)
+    old_runners = list(handler._switchbot_runners)
 
     # Mock signal connect/disconnect to verify they are called during update
     with (
@@ -484,9 +566,15 @@ async def test_apply_live_update_reinitializes_runners(automation_handler_factor
             "switchbot_actions.handlers.switchbot_advertisement_received"
         ) as mock_switchbot_signal,
         patch("switchbot_actions.handlers.mqtt_message_received") as mock_mqtt_signal,
+        patch(
+            "switchbot_actions.handlers.ActionRunner.close", autospec=True
+        ) as mock_close,
     ):
         await handler._apply_live_update(new_settings)
 
+        # Verify only the replaced runners were closed
+        assert [call.args[0] for call in mock_close.await_args_list] == old_runners
+
         # Verify signals were re-connected
         mock_switchbot_signal.disconnect.assert_called_once()
         mock_switchbot_signal.connect.assert_called_once()
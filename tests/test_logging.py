@@ -1,14 +1,25 @@
 import logging
-from unittest.mock import patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from switchbot_actions.config import LoggingSettings
 from switchbot_actions.logging import setup_logging
 
 
-@patch("logging.getLogger")
-@patch("logging.basicConfig")
-def test_setup_logging_debug_level_and_bleak_info(mock_basic_config, mock_get_logger):
+@pytest.fixture
+def patched_logging(monkeypatch):
+    """Replaces logging.basicConfig and logging.getLogger with mocks."""
+    mock_basic_config = MagicMock()
+    mock_get_logger = MagicMock()
+    monkeypatch.setattr("logging.basicConfig", mock_basic_config)
+    monkeypatch.setattr("logging.getLogger", mock_get_logger)
+    return mock_basic_config, mock_get_logger
+
+
+def test_setup_logging_debug_level_and_bleak_info(patched_logging):
     """Test that setup_logging correctly applies DEBUG level and bleak INFO logger."""
+    mock_basic_config, mock_get_logger = patched_logging
     settings = LoggingSettings(level="DEBUG", loggers={"bleak": "INFO"})
     setup_logging(settings)
 
@@ -22,10 +33,9 @@ def test_setup_logging_debug_level_and_bleak_info(mock_basic_config, mock_get_lo
     mock_get_logger.return_value.setLevel.assert_called_once_with(logging.INFO)
 
 
-@patch("logging.getLogger")
-@patch("logging.basicConfig")
-def test_setup_logging_from_config_with_loggers(mock_basic_config, mock_get_logger):
+def test_setup_logging_from_config_with_loggers(patched_logging):
     """Test that logging is configured from config file, including specific loggers."""
+    mock_basic_config, mock_get_logger = patched_logging
     settings = LoggingSettings(
         level="WARNING",
         format="%(message)s",
@@ -46,9 +56,9 @@ def test_setup_logging_from_config_with_loggers(mock_basic_config, mock_get_logg
     mock_get_logger.return_value.setLevel.assert_any_call(logging.CRITICAL)
 
 
-@patch("logging.basicConfig")
-def test_setup_logging_from_config_no_loggers(mock_basic_config):
+def test_setup_logging_from_config_no_loggers(patched_logging):
     """Test that logging is configured correctly when loggers section is missing."""
+    mock_basic_config, _ = patched_logging
     settings = LoggingSettings(level="INFO")
     setup_logging(settings)
 
@@ -29,7 +29,7 @@ def test_mqtt_client_initialization(mock_aiomqtt_client, mqtt_settings):
     mock_aiomqtt_client.assert_not_called()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_start_creates_real_client(mock_aiomqtt_client, mqtt_settings):
     """Test that start() creates and uses the real aiomqtt.Client."""
     client = MqttClient(settings=mqtt_settings)
@@ -45,7 +45,7 @@ async def test_start_creates_real_client(mock_aiomqtt_client, mqtt_settings):
     await client.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_message_reception_and_signal(mqtt_settings, mqtt_message_plain):
     """
     Tests that the MqttClient component correctly receives messages from the
@@ -98,7 +98,7 @@ async def test_message_reception_and_signal(mqtt_settings, mqtt_message_plain):
         assert received_signals[0].payload == b"ON"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_publish_message_for_null_client(mqtt_settings):
     client = MqttClient(settings=mqtt_settings)
     # Since the client is not started, it should use the _NullClient
@@ -109,20 +109,21 @@ async def test_publish_message_for_null_client(mqtt_settings):
     )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_publish_message(mqtt_settings):
     client = MqttClient(settings=mqtt_settings)
     client._run_mqtt_loop = AsyncMock()
     await client.start()
     client.client.publish = AsyncMock()
     await client.publish("test/topic", "test_payload")
+    await client.wait_for_pending_publishes()
     client.client.publish.assert_called_once_with(
         "test/topic", "test_payload", qos=0, retain=False
     )
     await client.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_publish_message_handles_error(mqtt_settings, caplog):
     client = MqttClient(settings=mqtt_settings)
     # Start the client to use the real aiomqtt.Client
@@ -133,21 +134,20 @@ async def test_publish_message_handles_error(mqtt_settings, caplog):
     real_client.publish = AsyncMock(side_effect=aiomqtt.MqttError("Test Error"))
 
     await client.publish("test/topic", "test_payload")
+    await client.wait_for_pending_publishes()
 
     assert "MQTT client not connected, cannot publish message." in caplog.text
     await client.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_mqtt_client_lifecycle_and_subscription(mqtt_settings):
     """
     Tests that the client starts, subscribes to topics, and stops gracefully.
     """
     subscribed_event = asyncio.Event()
 
-    with patch(
-        "switchbot_actions.mqtt.aiomqtt.Client", autospec=True
-    ) as mock_aiomqtt_client:
+    with patch("switchbot_actions.mqtt.aiomqtt.Client") as mock_aiomqtt_client:
         mock_instance = mock_aiomqtt_client.return_value
         mock_instance.__aenter__.return_value = mock_instance
 
@@ -180,7 +180,7 @@ async def test_mqtt_client_lifecycle_and_subscription(mqtt_settings):
         assert client._mqtt_loop_task is None
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_mqtt_client_reconnect_on_failure(mqtt_settings, caplog):
     """
     Tests that the client attempts to reconnect after a connection failure.
@@ -195,9 +195,7 @@ async def test_mqtt_client_reconnect_on_failure(mqtt_settings, caplog):
         patch(
             "switchbot_actions.mqtt.asyncio.sleep", new_callable=AsyncMock
         ) as mock_sleep,
-        patch(
-            "switchbot_actions.mqtt.aiomqtt.Client", autospec=True
-        ) as mock_aiomqtt_client,
+        patch("switchbot_actions.mqtt.aiomqtt.Client") as mock_aiomqtt_client,
     ):
         mock_aiomqtt_client.return_value.__aenter__.side_effect = aiomqtt.MqttError(
             "Connection failed"
@@ -215,7 +213,7 @@ async def test_mqtt_client_reconnect_on_failure(mqtt_settings, caplog):
         mock_sleep.assert_awaited_once_with(client.settings.reconnect_interval)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_publish_json_payload(mqtt_settings):
     """
     Tests that a dictionary payload is correctly serialized to a JSON string.
@@ -226,17 +224,21 @@ async def test_publish_json_payload(mqtt_settings):
     client.client.publish = AsyncMock()
 
     payload_dict = {"key": "value", "number": 123}
-    expected_json_string = json.dumps(payload_dict)
 
     await client.publish("test/json_topic", payload_dict)
-
-    client.client.publish.assert_called_once_with(
-        "test/json_topic", expected_json_string, qos=0, retain=False
-    )
+    await client.wait_for_pending_publishes()
+
+    client.client.publish.assert_called_once()
+    call = client.client.publish.call_args
+    assert call.args[0] == "test/json_topic"
+    assert json.loads(call.args[1]) == payload_dict
+    # The wire format matches json.dumps(), separators included
+    assert call.args[1] == json.dumps(payload_dict)
+    assert call.kwargs == {"qos": 0, "retain": False}
     await client.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_start_does_not_call__start_if_disabled():
     """
     Tests that the public start() method does not call the internal _start()
@@ -282,3 +284,156 @@ def test_no_restart_on_non_critical_settings_change(mqtt_settings):
     new_settings.reconnect_interval = 999
 
     assert client._require_restart(new_settings) is False
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_publish_does_not_wait_for_broker(mqtt_settings):
+    """Test that publish returns before the broker acknowledges the message."""
+    client = MqttClient(settings=mqtt_settings)
+    client._run_mqtt_loop = AsyncMock()
+    await client.start()
+
+    acknowledged = asyncio.Event()
+    published = []
+
+    async def slow_publish(topic, payload, qos, retain):
+        await acknowledged.wait()
+        published.append((topic, payload))
+
+    client.client.publish = AsyncMock(side_effect=slow_publish)
+
+    await client.publish("test/first", "1")
+    await client.publish("test/second", "2")
+    assert published == []
+
+    acknowledged.set()
+    await client.wait_for_pending_publishes()
+    assert published == [("test/first", "1"), ("test/second", "2")]
+
+    await client.stop()
+    assert client._publish_worker is None
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stop_publishes_queued_messages_first(mqtt_settings):
+    """Test that stop() drains the publish queue before the worker is cancelled."""
+    client = MqttClient(settings=mqtt_settings)
+    client._run_mqtt_loop = AsyncMock()
+    await client.start()
+    real_client = client.client
+    real_client.publish = AsyncMock()
+
+    await client.publish("test/first", "1")
+    await client.publish("test/second", "2")
+    await client.stop()
+
+    assert [call.args[0] for call in real_client.publish.await_args_list] == [
+        "test/first",
+        "test/second",
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stop_gives_up_on_queued_messages_after_timeout(mqtt_settings, caplog):
+    """Test that stop() does not hang when the broker never acknowledges."""
+    client = MqttClient(settings=mqtt_settings)
+    client._run_mqtt_loop = AsyncMock()
+    await client.start()
+
+    async def never_acknowledged(*args, **kwargs):
+        await asyncio.Event().wait()
+
+    client.client.publish = AsyncMock(side_effect=never_acknowledged)
+
+    await client.publish("test/topic", "1")
+    with patch("switchbot_actions.mqtt.PUBLISH_DRAIN_TIMEOUT", 0.01):
+        await client.stop()
+
+    assert "were not published" in caplog.text
+    assert client._publish_worker is None
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_publish_while_stopping_leaves_no_worker_behind(mqtt_settings):
+    """Test that messages published during stop() do not start a new worker."""
+    client = MqttClient(settings=mqtt_settings)
+
+    async def loop_publishing_on_cancel():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            # Arrives after the queue was drained, while the loop is cancelled
+            client.publish_nowait("test/late", "2")
+            await client.publish("test/late", "3")
+            raise
+
+    client._run_mqtt_loop = loop_publishing_on_cancel
+    await client.start()
+    real_client = client.client
+    real_client.publish = AsyncMock()
+
+    await client.publish("test/first", "1")
+    await client.stop()
+
+    real_client.publish.assert_awaited_once_with("test/first", "1", qos=0, retain=False)
+    assert client._publish_queue is None
+    assert client._publish_worker is None
+    assert not [
+        task
+        for task in asyncio.all_tasks()
+        if task.get_coro().__qualname__ == "MqttClient._run_publish_worker"
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_publish_after_restart_is_queued_again(mqtt_settings):
+    """Test that a stopped client accepts messages again once restarted."""
+    client = MqttClient(settings=mqtt_settings)
+    client._run_mqtt_loop = AsyncMock()
+    await client.start()
+    await client.stop()
+    await client.start()
+    real_client = client.client
+    real_client.publish = AsyncMock()
+
+    await client.publish("test/topic", "1")
+    await client.stop()
+
+    real_client.publish.assert_awaited_once_with("test/topic", "1", qos=0, retain=False)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_publish_nowait_waits_for_room_in_full_queue(mqtt_settings):
+    """Test that messages are kept in order, not dropped, when the queue is full."""
+    client = MqttClient(settings=mqtt_settings)
+    client._run_mqtt_loop = AsyncMock()
+    await client.start()
+
+    acknowledged = asyncio.Event()
+    published = []
+
+    async def slow_publish(topic, payload, qos, retain):
+        await acknowledged.wait()
+        published.append(payload)
+
+    client.client.publish = AsyncMock(side_effect=slow_publish)
+
+    with patch("switchbot_actions.mqtt.PUBLISH_QUEUE_MAXSIZE", 1):
+        for i in range(4):
+            client.publish_nowait("test/topic", str(i))
+
+    acknowledged.set()
+    await client.wait_for_pending_publishes()
+    assert published == ["0", "1", "2", "3"]
+
+    await client.stop()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_publish_nowait_ignores_messages_before_start(mqtt_settings):
+    """Test that publish_nowait drops messages while the null client is active."""
+    client = MqttClient(settings=mqtt_settings)
+
+    client.publish_nowait("test/topic", {"key": "value"})
+
+    assert client._publish_queue is None
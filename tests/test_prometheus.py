@@ -1,8 +1,8 @@
 # tests/test_exporter.py
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client import CollectorRegistry
 
 from switchbot_actions.config import DeviceSettings, PrometheusExporterSettings
 from switchbot_actions.prometheus import PrometheusExporter
@@ -13,32 +13,24 @@ from switchbot_actions.signals import (
 )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def stub_start_http_server():
+    """Replaces the HTTP server start with a no-op for the whole module."""
+    server_and_thread = (object(), object())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "switchbot_actions.prometheus.start_http_server",
+            lambda *args, **kwargs: server_and_thread,
+        )
+        yield
+
+
 @pytest.fixture
 def test_registry():
     return CollectorRegistry()
 
 
-@pytest.fixture(autouse=True)
-def cleanup_registry():
-    """Removes test metrics from the REGISTRY after each test to ensure isolation."""
-    yield
-    metric_names_to_remove = [
-        "switchbot_temperature",
-        "switchbot_humidity",
-        "switchbot_battery",
-        "switchbot_rssi",
-        "switchbot_isOn",
-        "switchbot_device_info",
-        "switchbot_scan_duration_seconds",
-        "switchbot_advertisements",
-    ]
-    collectors = list(REGISTRY._collector_to_names.keys())
-    for collector in collectors:
-        if hasattr(collector, "_name") and collector._name in metric_names_to_remove:  # pyright:ignore[reportAttributeAccessIssue]
-            REGISTRY.unregister(collector)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_state_1(mock_switchbot_advertisement):
     return mock_switchbot_advertisement(
         address="DE:AD:BE:EF:33:33",
@@ -55,7 +47,7 @@ def mock_state_1(mock_switchbot_advertisement):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_state_2(mock_switchbot_advertisement):
     return mock_switchbot_advertisement(
         address="DE:AD:BE:EF:44:44",
@@ -64,7 +56,7 @@ def mock_state_2(mock_switchbot_advertisement):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_state_unconfigured(mock_switchbot_advertisement):
     return mock_switchbot_advertisement(
         address="AA:BB:CC:DD:EE:FF",
@@ -84,98 +76,59 @@ def configured_exporter_settings():
     )  # pyright:ignore[reportCallIssue]
 
 
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
-async def test_info_metric_initialization(
-    mock_start_http_server, configured_exporter_settings, test_registry
-):
-    """Test that switchbot_device_info is initialized correctly at startup."""
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
+def sample_snapshot(registry):
+    """Collects every sample once, keyed by (name, frozenset of label items)."""
+    return {
+        (sample.name, frozenset(sample.labels.items())): sample.value
+        for metric in registry.collect()
+        for sample in metric.samples
+    }
+
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_info_metric_initialization(configured_exporter_settings, test_registry):
+    """Test that switchbot_device_info is initialized correctly at startup."""
     exporter = PrometheusExporter(
         settings=configured_exporter_settings, registry=test_registry
     )
     await exporter.start()
 
+    samples = sample_snapshot(test_registry)
+
     # Verify initial state for living_room_meter
-    info_value_lr = test_registry.get_sample_value(
-        "switchbot_device_info",
-        labels={
-            "address": "DE:AD:BE:EF:33:33",
-            "name": "living_room_meter",
-            "model": "Unknown",
-        },
-    )
-    assert info_value_lr == 1.0
+    info_labels_lr = {
+        "address": "DE:AD:BE:EF:33:33",
+        "name": "living_room_meter",
+        "model": "Unknown",
+    }
+    assert samples[("switchbot_device_info", frozenset(info_labels_lr.items()))] == 1.0
 
     # Verify initial state for bedroom_bot
-    info_value_bb = test_registry.get_sample_value(
-        "switchbot_device_info",
-        labels={
-            "address": "DE:AD:BE:EF:44:44",
-            "name": "bedroom_bot",
-            "model": "Unknown",
-        },
-    )
-    assert info_value_bb == 1.0
+    info_labels_bb = {
+        "address": "DE:AD:BE:EF:44:44",
+        "name": "bedroom_bot",
+        "model": "Unknown",
+    }
+    assert samples[("switchbot_device_info", frozenset(info_labels_bb.items()))] == 1.0
 
     await exporter.stop()
 
 
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
-async def test_exporter_handle_advertisement(
-    mock_start_http_server, mock_state_1, test_registry
-):
-    """Test that the exporter correctly handles an advertisement and updates gauges."""
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
-
-    settings = PrometheusExporterSettings(enabled=True)  # pyright:ignore[reportCallIssue]
-    exporter = PrometheusExporter(settings=settings, registry=test_registry)
-
-    await exporter.start()  # Await the start method
-
-    # Send a signal to trigger `handle_advertisement`
-    switchbot_advertisement_received.send(exporter, new_state=mock_state_1)
-
-    # Verify the value directly from the REGISTRY
-    temp_value = test_registry.get_sample_value(
-        "switchbot_temperature",
-        labels={"address": "DE:AD:BE:EF:33:33", "model": "WoSensorTH"},
-    )
-    assert temp_value == 22.5
-
-    rssi_value = test_registry.get_sample_value(
-        "switchbot_rssi",
-        labels={"address": "DE:AD:BE:EF:33:33", "model": "WoSensorTH"},
-    )
-    assert rssi_value == -55
-
-    # Verify that non-numeric data does not create a gauge
-    assert test_registry.get_sample_value("switchbot_some_non_numeric") is None
-
-    await exporter.stop()  # Await the stop method
-
-
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
+@pytest.mark.asyncio(loop_scope="module")
 async def test_info_metric_update_on_advertisement(
-    mock_start_http_server,
     configured_exporter_settings,
     mock_state_1,
     mock_state_unconfigured,
     test_registry,
 ):
     """Test that info metric is updated and unconfigured devices are ignored."""
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
-
     exporter = PrometheusExporter(
         settings=configured_exporter_settings, registry=test_registry
     )
     await exporter.start()
 
     # Send advertisement for a configured device (mock_state_1)
-    switchbot_advertisement_received.send(exporter, new_state=mock_state_1)
+    exporter.handle_advertisement(exporter, new_state=mock_state_1)
 
     # Verify that the model name is updated for mock_state_1
     info_value_updated = test_registry.get_sample_value(
@@ -189,7 +142,7 @@ async def test_info_metric_update_on_advertisement(
     assert info_value_updated == 1.0
 
     # Send advertisement for an unconfigured device (mock_state_unconfigured)
-    switchbot_advertisement_received.send(exporter, new_state=mock_state_unconfigured)
+    exporter.handle_advertisement(exporter, new_state=mock_state_unconfigured)
 
     # Verify that no info metric is created for the unconfigured device
     info_value_unconfigured = test_registry.get_sample_value(
@@ -205,86 +158,87 @@ async def test_info_metric_update_on_advertisement(
     await exporter.stop()
 
 
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
-async def test_metric_filtering(mock_start_http_server, mock_state_1, test_registry):
-    """Test that metrics are filtered based on the target config."""
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
-
-    settings = PrometheusExporterSettings(
-        enabled=True, target={"metrics": ["temperature", "battery"]}
-    )  # pyright:ignore[reportCallIssue]
+def handle_states(exporter, states):
+    """Feeds advertisements straight to the exporter, bypassing the signal."""
+    for state in states:
+        exporter.handle_advertisement(exporter, new_state=state)
+
+
+METER_LABELS = {"address": "DE:AD:BE:EF:33:33", "model": "WoSensorTH"}
+BOT_LABELS = {"address": "DE:AD:BE:EF:44:44", "model": "WoHand"}
+
+
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize(
+    "settings_kwargs, state_fixtures, expected_samples",
+    [
+        pytest.param(
+            {},
+            ["mock_state_1"],
+            [
+                ("switchbot_temperature", METER_LABELS, 22.5),
+                ("switchbot_rssi", METER_LABELS, -55),
+                # Non-numeric data does not create a gauge
+                ("switchbot_some_non_numeric", METER_LABELS, None),
+            ],
+            id="handle_advertisement",
+        ),
+        pytest.param(
+            {"target": {"metrics": ["temperature", "battery"]}},
+            ["mock_state_1"],
+            [
+                ("switchbot_temperature", METER_LABELS, 22.5),
+                ("switchbot_humidity", METER_LABELS, None),
+            ],
+            id="metric_filtering",
+        ),
+        pytest.param(
+            {"target": {"addresses": ["DE:AD:BE:EF:44:44"]}},  # only mock_state_2
+            ["mock_state_1", "mock_state_2"],
+            [
+                ("switchbot_temperature", METER_LABELS, None),
+                ("switchbot_isOn", BOT_LABELS, 1.0),
+            ],
+            id="address_filtering",
+        ),
+    ],
+)
+async def test_exporter_updates_gauges(
+    request, test_registry, settings_kwargs, state_fixtures, expected_samples
+):
+    """Test that advertisements update gauges, honouring the target filters."""
+    settings = PrometheusExporterSettings(enabled=True, **settings_kwargs)  # pyright:ignore[reportCallIssue]
     exporter = PrometheusExporter(settings=settings, registry=test_registry)
+    await exporter.start()
 
-    await exporter.start()  # Await the start method
-
-    switchbot_advertisement_received.send(exporter, new_state=mock_state_1)
+    handle_states(exporter, [request.getfixturevalue(name) for name in state_fixtures])
 
-    # Metric that should exist
-    assert (
-        test_registry.get_sample_value(
-            "switchbot_temperature",
-            labels={"address": "DE:AD:BE:EF:33:33", "model": "WoSensorTH"},
-        )
-        == 22.5
-    )
-    # Filtered metric should be None
-    assert (
-        test_registry.get_sample_value(
-            "switchbot_humidity",
-            labels={"address": "DE:AD:BE:EF:33:33", "model": "WoSensorTH"},
-        )
-        is None
-    )
+    samples = sample_snapshot(test_registry)
+    for metric, labels, expected in expected_samples:
+        assert samples.get((metric, frozenset(labels.items()))) == expected
 
-    await exporter.stop()  # Await the stop method
+    await exporter.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @patch("switchbot_actions.prometheus.start_http_server")
-async def test_address_filtering(
-    mock_start_http_server, mock_state_1, mock_state_2, test_registry
+async def test_start_serves_registry_on_configured_port(
+    mock_start_http_server, test_registry
 ):
-    """Test that devices are filtered based on the target addresses."""
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
+    """Test that the HTTP server is started on the configured port and registry."""
+    mock_start_http_server.return_value = (object(), object())
 
-    settings = PrometheusExporterSettings(
-        enabled=True,
-        target={"addresses": ["DE:AD:BE:EF:44:44"]},  # only mock_state_2
-    )  # pyright:ignore[reportCallIssue]
+    settings = PrometheusExporterSettings(enabled=True, port=9876)  # pyright:ignore[reportCallIssue]
     exporter = PrometheusExporter(settings=settings, registry=test_registry)
 
-    await exporter.start()  # Await the start method
-
-    mock_start_http_server.assert_called_once_with(
-        settings.port, registry=test_registry
-    )
+    await exporter.start()
 
-    # Send signals for both devices
-    switchbot_advertisement_received.send(exporter, new_state=mock_state_1)
-    switchbot_advertisement_received.send(exporter, new_state=mock_state_2)
+    mock_start_http_server.assert_called_once_with(9876, registry=test_registry)
 
-    # Metric for mock_state_1 should be None
-    assert (
-        test_registry.get_sample_value(
-            "switchbot_temperature",
-            labels={"address": "DE:AD:BE:EF:33:33", "model": "WoSensorTH"},
-        )
-        is None
-    )
-    # Metric for mock_state_2 should exist
-    assert (
-        test_registry.get_sample_value(
-            "switchbot_isOn",
-            labels={"address": "DE:AD:BE:EF:44:44", "model": "WoHand"},
-        )
-        == 1.0
-    )
-
-    await exporter.stop()  # Await the stop method
+    await exporter.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_start_does_not_call__start_if_disabled(test_registry):
     """
     Tests that the public start() method does not call the internal _start()
@@ -325,16 +279,12 @@ def test_no_restart_on_other_settings_change(test_registry):
     assert exporter._require_restart(new_settings) is False
 
 
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
-async def test_apply_live_update_recreates_info_gauge(
-    mock_start_http_server, test_registry
-):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_apply_live_update_recreates_info_gauge(test_registry):
     """
     Tests that a live update correctly removes old device info metrics and
     creates new ones when the device list changes.
     """
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
     initial_settings = PrometheusExporterSettings(
         enabled=True,
         devices={
@@ -398,74 +348,52 @@ async def test_apply_live_update_recreates_info_gauge(
     await exporter.stop()
 
 
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
-async def test_action_duration_histogram_updates(mock_start_http_server, test_registry):
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
-
+@pytest.mark.asyncio(loop_scope="module")
+async def test_action_duration_histogram_updates(test_registry):
     settings = PrometheusExporterSettings(enabled=True)  # pyright:ignore[reportCallIssue]
     exporter = PrometheusExporter(settings=settings, registry=test_registry)
     await exporter.start()
 
     action_executed.send(exporter, action_type="webhook", duration=0.25)
 
-    assert (
-        test_registry.get_sample_value(
-            "switchbot_action_duration_seconds_count",
-            labels={"action_type": "webhook"},
-        )
-        == 1.0
+    samples = sample_snapshot(test_registry)
+    labels = frozenset({"action_type": "webhook"}.items())
+    assert samples[("switchbot_action_duration_seconds_count", labels)] == 1.0
+    assert samples[("switchbot_action_duration_seconds_sum", labels)] == pytest.approx(
+        0.25
     )
-    assert test_registry.get_sample_value(
-        "switchbot_action_duration_seconds_sum",
-        labels={"action_type": "webhook"},
-    ) == pytest.approx(0.25)
 
     await exporter.stop()
 
 
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
-async def test_scan_duration_summary_updates(mock_start_http_server, test_registry):
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
-
+@pytest.mark.asyncio(loop_scope="module")
+async def test_scan_duration_summary_updates(test_registry):
     settings = PrometheusExporterSettings(enabled=True)  # pyright:ignore[reportCallIssue]
     exporter = PrometheusExporter(settings=settings, registry=test_registry)
     await exporter.start()
 
     scan_executed.send(exporter, interface=0, scan_duration=1.25, cycle_duration=1.75)
 
-    assert (
-        test_registry.get_sample_value(
-            "switchbot_scan_duration_seconds_count",
-            labels={"interface": "0"},
-        )
-        == 1.0
+    samples = sample_snapshot(test_registry)
+    labels = frozenset({"interface": "0"}.items())
+    assert samples[("switchbot_scan_duration_seconds_count", labels)] == 1.0
+    assert samples[("switchbot_scan_duration_seconds_sum", labels)] == pytest.approx(
+        1.25
+    )
+    assert samples[("switchbot_cycle_duration_seconds_sum", labels)] == pytest.approx(
+        1.75
     )
-    assert test_registry.get_sample_value(
-        "switchbot_scan_duration_seconds_sum",
-        labels={"interface": "0"},
-    ) == pytest.approx(1.25)
-
-    assert test_registry.get_sample_value(
-        "switchbot_cycle_duration_seconds_sum",
-        labels={"interface": "0"},
-    ) == pytest.approx(1.75)
 
     await exporter.stop()
 
 
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
-async def test_advertisements_counter_increments(
-    mock_start_http_server, mock_state_1, test_registry
-):
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
-
+@pytest.mark.asyncio(loop_scope="module")
+async def test_advertisements_counter_increments(mock_state_1, test_registry):
     settings = PrometheusExporterSettings(enabled=True)  # pyright:ignore[reportCallIssue]
     exporter = PrometheusExporter(settings=settings, registry=test_registry)
     await exporter.start()
 
+    # Sent through the signal to cover the wiring set up by start()
     switchbot_advertisement_received.send(exporter, new_state=mock_state_1)
 
     assert (
@@ -479,13 +407,10 @@ async def test_advertisements_counter_increments(
     await exporter.stop()
 
 
-@pytest.mark.asyncio
-@patch("switchbot_actions.prometheus.start_http_server")
+@pytest.mark.asyncio(loop_scope="module")
 async def test_advertisements_counter_respects_address_filtering(
-    mock_start_http_server, mock_state_1, mock_state_2, test_registry
+    mock_state_1, mock_state_2, test_registry
 ):
-    mock_start_http_server.return_value = [MagicMock(), Mock()]
-
     settings = PrometheusExporterSettings(
         enabled=True,
         target={"addresses": ["DE:AD:BE:EF:44:44"]},  # only mock_state_2
@@ -493,22 +418,32 @@ async def test_advertisements_counter_respects_address_filtering(
     exporter = PrometheusExporter(settings=settings, registry=test_registry)
     await exporter.start()
 
-    switchbot_advertisement_received.send(exporter, new_state=mock_state_1)
-    switchbot_advertisement_received.send(exporter, new_state=mock_state_2)
+    handle_states(exporter, [mock_state_1, mock_state_2])
 
-    assert (
-        test_registry.get_sample_value(
-            "switchbot_advertisements_total",
-            labels={"address": "DE:AD:BE:EF:33:33", "model": "WoSensorTH"},
-        )
-        is None
-    )
-    assert (
-        test_registry.get_sample_value(
-            "switchbot_advertisements_total",
-            labels={"address": "DE:AD:BE:EF:44:44", "model": "WoHand"},
-        )
-        == 1.0
+    samples = sample_snapshot(test_registry)
+    meter_key = ("switchbot_advertisements_total", frozenset(METER_LABELS.items()))
+    bot_key = ("switchbot_advertisements_total", frozenset(BOT_LABELS.items()))
+    assert meter_key not in samples
+    assert samples[bot_key] == 1.0
+
+    await exporter.stop()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_stop_unregisters_all_owned_collectors(
+    configured_exporter_settings, mock_state_1, test_registry
+):
+    """Test that stop() removes every collector the exporter registered."""
+    exporter = PrometheusExporter(
+        settings=configured_exporter_settings, registry=test_registry
     )
+    await exporter.start()
+    exporter.handle_advertisement(exporter, new_state=mock_state_1)
+    assert exporter._owned_collectors()
 
     await exporter.stop()
+
+    assert exporter._owned_collectors() == []
+    assert not any(
+        metric.name.startswith("switchbot_") for metric in test_registry.collect()
+    )
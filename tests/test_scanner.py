@@ -7,7 +7,6 @@ import pytest
 from switchbot_actions.config import ScannerSettings
 from switchbot_actions.scanner import SwitchbotScanner
 from switchbot_actions.signals import switchbot_advertisement_received
-from switchbot_actions.store import StateStore
 
 
 @pytest.fixture
@@ -28,15 +27,9 @@ def mock_ble_scanner(mock_switchbot_advertisement):
     return scanner
 
 
-@pytest.fixture
-def mock_storage():
-    """Provides a mock StateStore."""
-    return MagicMock(spec=StateStore)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scanner_settings():
-    """Provides mock ScannerSettings."""
+    """Provides mock ScannerSettings; tests copy them before changing anything."""
     return ScannerSettings(interface=0, duration=1, wait=1)
 
 
@@ -46,13 +39,15 @@ def scanner(mock_ble_scanner, scanner_settings):
     return SwitchbotScanner(settings=scanner_settings, scanner=mock_ble_scanner)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_scanner_start_and_stop_succeeds(scanner, mock_ble_scanner):
     """Test that the scanner starts, sends a signal, and stops gracefully."""
     received_signal = []
+    signal_received = asyncio.Event()
 
     def on_switchbot_advertisement_received(sender, **kwargs):
         received_signal.append(kwargs)
+        signal_received.set()
 
     switchbot_advertisement_received.connect(on_switchbot_advertisement_received)
 
@@ -60,8 +55,8 @@ async def test_scanner_start_and_stop_succeeds(scanner, mock_ble_scanner):
     await scanner.start()
     assert scanner.task is not None
 
-    # Give the background task a moment to run one loop
-    await asyncio.sleep(0.1)
+    # Wait for the background task to finish one loop
+    await asyncio.wait_for(signal_received.wait(), timeout=1)
 
     # Assert that discover was called
     mock_ble_scanner.discover.assert_called_with(scan_timeout=1)
@@ -87,7 +82,7 @@ async def test_scanner_start_and_stop_succeeds(scanner, mock_ble_scanner):
         (Exception("Bluetooth device is turned off"), False),  # Known error
     ],
 )
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @patch("logging.Logger.error")
 async def test_scanner_error_handling(
     mock_log_error,
@@ -101,13 +96,15 @@ async def test_scanner_error_handling(
     """
     # Configure the mock scanner to raise the test exception
     mock_ble_scanner.discover.side_effect = error_exception
+    error_logged = asyncio.Event()
+    mock_log_error.side_effect = lambda *args, **kwargs: error_logged.set()
 
     # Start the scanner, which starts the _scan_loop in the background
     await scanner.start()
     assert scanner.task is not None
 
-    # Give the background task a moment to run, encounter the error, and log it.
-    await asyncio.sleep(0.1)
+    # Wait for the background task to encounter the error and log it
+    await asyncio.wait_for(error_logged.wait(), timeout=1)
 
     # Verify that the error was logged correctly
     mock_log_error.assert_called_once()
@@ -162,7 +159,7 @@ def test_format_ble_error_message(
     assert is_known_error == expected_is_known_error
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_scanner_already_running_warning(scanner):
     """Test that starting an already running scanner logs a warning."""
     scanner._running = True  # Manually set state for test
@@ -172,7 +169,7 @@ async def test_scanner_already_running_warning(scanner):
         mock_log_warning.assert_called_once_with("SwitchbotScanner is already running.")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_scanner_not_running_warning(scanner):
     """Test that stopping a not running scanner logs a debug message."""
     scanner._running = False  # Manually set state for test
@@ -182,7 +179,7 @@ async def test_scanner_not_running_warning(scanner):
         mock_log_debug.assert_called_once_with("SwitchbotScanner is not running.")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_switchbot_client_initializes_scanner_internally(scanner_settings):
     """
     Test that SwitchbotScanner initializes GetSwitchbotDevices internally
@@ -202,17 +199,19 @@ async def test_switchbot_client_initializes_scanner_internally(scanner_settings)
         # Verify that the internal _scanner attribute is set to the mock instance
         assert client._scanner == MockGetSwitchbotDevices.return_value
 
-        # Configure mock discover to return empty dict then raise CancelledError
-        MockGetSwitchbotDevices.return_value.discover.side_effect = [
-            {},
-            asyncio.CancelledError,
-        ]
+        # Configure mock discover to return an empty dict and flag the call
+        discovered = asyncio.Event()
+
+        def discover(*args, **kwargs):
+            discovered.set()
+            return {}
+
+        MockGetSwitchbotDevices.return_value.discover.side_effect = discover
 
         # Ensure start/stop can still be called
         await client.start()
-        # The loop should stop after one iteration due to the mock's side_effect
-        # Wait a bit to ensure the task has been processed
-        await asyncio.sleep(0.1)
+        # Wait for the first loop iteration to reach discover
+        await asyncio.wait_for(discovered.wait(), timeout=1)
 
         MockGetSwitchbotDevices.return_value.discover.assert_called()
         await client.stop()
@@ -245,3 +244,17 @@ def test_no_restart_on_timing_settings_change(scanner_settings, setting_to_chang
     setattr(new_settings, setting_to_change, 99)
 
     assert scanner._require_restart(new_settings) is False
+
+
+def test_process_advertisement_skips_empty_data(scanner, mock_switchbot_advertisement):
+    """Test that only advertisements with data are sent as signals."""
+    with patch.object(switchbot_advertisement_received, "send") as mock_send:
+        scanner._process_advertisement(
+            mock_switchbot_advertisement(address="DE:AD:BE:EF:00:01", data={})
+        )
+        mock_send.assert_not_called()
+
+        advertisement = mock_switchbot_advertisement(address="DE:AD:BE:EF:00:02")
+        scanner._process_advertisement(advertisement)
+
+    mock_send.assert_called_once_with(scanner, new_state=advertisement)
@@ -8,9 +8,16 @@ from switchbot_actions.state import (
     StateObject,
     StateSnapshot,
     _NullState,
+    _parse_template,
     create_state_object,
 )
-from switchbot_actions.triggers import EdgeTrigger, _evaluate_single_condition
+from switchbot_actions.triggers import EdgeTrigger
+
+
+@pytest.fixture
+def mutable_state(sample_state):
+    """A per-test copy of the module-scoped sample_state, safe to mutate."""
+    return create_state_object(sample_state._raw_event)
 
 
 @pytest.fixture
@@ -188,6 +195,39 @@ def test_state_object_attribute_access(mock_raw_event, mock_previous_raw_event):
         _ = state_object.non_existent_attribute
 
 
+def test_state_object_builds_values_dict_once(mqtt_message_json):
+    state_object = create_state_object(mqtt_message_json)
+
+    state_class = type(state_object)
+    with patch.object(
+        state_class,
+        "_get_values_as_dict",
+        autospec=True,
+        side_effect=state_class._get_values_as_dict,
+    ) as mock_build:
+        assert state_object.temperature == 28.5
+        assert state_object.format("{humidity}%") == "55%"
+        assert not hasattr(state_object, "non_existent_attribute")
+
+    mock_build.assert_called_once()
+
+
+def test_state_object_has_no_instance_dict(mock_raw_event):
+    state_object = create_state_object(mock_raw_event)
+    assert not hasattr(state_object, "__dict__")
+    with pytest.raises(AttributeError):
+        setattr(state_object, "unexpected", 1)
+
+
+def test_mqtt_state_skips_json_parse_for_plain_payload(mqtt_message_plain):
+    state_object = create_state_object(mqtt_message_plain)
+
+    with patch("switchbot_actions.state.json.loads") as mock_loads:
+        assert state_object.payload == "ON"
+
+    mock_loads.assert_not_called()
+
+
 def test_create_state_object_with_previous_argument(
     mock_raw_event, mock_previous_raw_event
 ):
@@ -309,86 +349,67 @@ def test_state_object_format_access_previous_object(
     )
 
 
-@pytest.mark.parametrize(
-    "condition, value, expected",
-    [
-        ("== 25.0", 25.0, True),
-        ("25", 25.0, True),
-        ("> 20", 25.0, True),
-        ("< 30", 25.0, True),
-        ("!= 30", 25.0, True),
-        ("true", True, True),
-        ("false", False, True),
-        ("invalid", 123, False),
-    ],
-)
-def test_evaluate_single_condition(condition, value, expected):
-    """Test various condition evaluations using _evaluate_single_condition."""
-    assert _evaluate_single_condition(condition, value) == expected
-
-
-def test_check_conditions_device_pass(sample_state: StateObject):
-    """Test that device conditions pass using Trigger._check_all_conditions."""
-    if_config = AutomationIf(
-        source="switchbot",
-        conditions={
-            "address": "e1:22:33:44:55:66",
-            "modelName": "WoSensorTH",
-        },
-    )
-    trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is True
-
-
-def test_check_conditions_device_fail(sample_state: StateObject):
-    """Test that device conditions fail using Trigger._check_all_conditions."""
-    if_config = AutomationIf(
-        source="switchbot",
-        conditions={
-            "address": "e1:22:33:44:55:66",
-            "modelName": "WoPresence",
-        },
-    )
-    trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+def test_state_object_format_reuses_parsed_template(mock_raw_event):
+    state_object = create_state_object(mock_raw_event)
+    template = "Reused template: {temperature}"
+    _parse_template.cache_clear()
 
+    assert state_object.format(template) == "Reused template: 25.5"
+    misses_after_first_render = _parse_template.cache_info().misses
 
-def test_check_conditions_state_pass(sample_state: StateObject):
-    """Test that state conditions pass using Trigger._check_all_conditions."""
-    if_config = AutomationIf(
-        source="switchbot",
-        conditions={"temperature": "> 20", "humidity": "< 60"},
-    )
-    trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is True
+    assert state_object.format(template) == "Reused template: 25.5"
+    assert _parse_template.cache_info().misses == misses_after_first_render
 
 
-def test_check_conditions_state_fail(sample_state: StateObject):
-    """Test that state conditions fail using Trigger._check_all_conditions."""
-    if_config = AutomationIf(source="switchbot", conditions={"temperature": "> 30"})
-    trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+@pytest.mark.parametrize(
+    "template, expected",
+    [
+        ("http://example.com/hook", "http://example.com/hook"),
+        ("Escaped {{braces}}", "Escaped {braces}"),
+        ("Temp: {temperature}", "Temp: 25.5"),
+    ],
+)
+def test_state_object_format_skips_formatter_for_literal_strings(
+    mock_raw_event, template, expected
+):
+    state_object = create_state_object(mock_raw_event)
+    _parse_template.cache_clear()
 
+    assert state_object.format(template) == expected
 
-def test_check_conditions_rssi(sample_state: StateObject):
-    """Test that RSSI conditions are checked correctly using
-    Trigger._check_all_conditions."""
-    if_config = AutomationIf(source="switchbot", conditions={"rssi": "> -60"})
-    trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is True
-    if_config = AutomationIf(source="switchbot", conditions={"rssi": "< -60"})
-    trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+    cache_info = _parse_template.cache_info()
+    assert (cache_info.hits + cache_info.misses > 0) is ("{" in template)
 
 
-def test_check_conditions_no_data(sample_state: StateObject):
-    """Test conditions when a key is not in state data using
-    Trigger._check_all_conditions."""
-    if_config = AutomationIf(
-        source="switchbot", conditions={"non_existent_key": "some_value"}
-    )
+@pytest.mark.parametrize(
+    "conditions, expected",
+    [
+        pytest.param(
+            {"address": "e1:22:33:44:55:66", "modelName": "WoSensorTH"},
+            True,
+            id="device_pass",
+        ),
+        pytest.param(
+            {"address": "e1:22:33:44:55:66", "modelName": "WoPresence"},
+            False,
+            id="device_fail",
+        ),
+        pytest.param(
+            {"temperature": "> 20", "humidity": "< 60"}, True, id="state_pass"
+        ),
+        pytest.param({"temperature": "> 30"}, False, id="state_fail"),
+        pytest.param({"rssi": "> -60"}, True, id="rssi_pass"),
+        pytest.param({"rssi": "< -60"}, False, id="rssi_fail"),
+        pytest.param({"non_existent_key": "some_value"}, False, id="no_data"),
+    ],
+)
+def test_check_conditions_switchbot(
+    sample_state: StateObject, conditions: dict, expected: bool
+):
+    """Test Trigger._check_all_conditions against a SwitchBot state."""
+    if_config = AutomationIf(source="switchbot", conditions=conditions)
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+    assert trigger._check_all_conditions(sample_state) is expected
 
 
 def test_check_conditions_mqtt_payload_pass(
@@ -462,47 +483,47 @@ def test_check_conditions_mqtt_json_no_key(
     assert trigger._check_all_conditions(state) is False
 
 
-def test_check_conditions_boolean_values(sample_state: StateObject):
+def test_check_conditions_boolean_values(mutable_state: StateObject):
     """Test boolean condition evaluation."""
-    # Assuming sample_state can be mocked or has a 'power' attribute
-    # For this test, we'll temporarily modify the sample_state's internal dict
+    # Assuming mutable_state can be mocked or has a 'power' attribute
+    # For this test, we'll temporarily modify the mutable_state's internal dict
     # In a real scenario, you'd mock the _get_values_as_dict or use a specific
     # state object
-    sample_state._cached_values = {"power": True}
+    mutable_state._cached_values = {"power": True}
     if_config = AutomationIf(source="switchbot", conditions={"power": "true"})
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is True
+    assert trigger._check_all_conditions(mutable_state) is True
 
-    sample_state._cached_values = {"power": False}
+    mutable_state._cached_values = {"power": False}
     if_config = AutomationIf(source="switchbot", conditions={"power": "false"})
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is True
+    assert trigger._check_all_conditions(mutable_state) is True
 
-    sample_state._cached_values = {"power": True}
+    mutable_state._cached_values = {"power": True}
     if_config = AutomationIf(source="switchbot", conditions={"power": "false"})
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+    assert trigger._check_all_conditions(mutable_state) is False
 
 
-def test_check_conditions_string_comparison(sample_state: StateObject):
+def test_check_conditions_string_comparison(mutable_state: StateObject):
     """Test string condition evaluation."""
-    sample_state._cached_values = {"status": "open"}
+    mutable_state._cached_values = {"status": "open"}
     if_config = AutomationIf(source="switchbot", conditions={"status": "== open"})
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is True
+    assert trigger._check_all_conditions(mutable_state) is True
 
     if_config = AutomationIf(source="switchbot", conditions={"status": "!= closed"})
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is True
+    assert trigger._check_all_conditions(mutable_state) is True
 
     if_config = AutomationIf(source="switchbot", conditions={"status": "== closed"})
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+    assert trigger._check_all_conditions(mutable_state) is False
 
 
-def test_check_conditions_combined_conditions(sample_state: StateObject):
+def test_check_conditions_combined_conditions(mutable_state: StateObject):
     """Test evaluation of multiple conditions (AND logic)."""
-    sample_state._cached_values = {"temperature": 25.0, "humidity": 50, "power": True}
+    mutable_state._cached_values = {"temperature": 25.0, "humidity": 50, "power": True}
     if_config = AutomationIf(
         source="switchbot",
         conditions={
@@ -512,7 +533,7 @@ def test_check_conditions_combined_conditions(sample_state: StateObject):
         },
     )
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is True
+    assert trigger._check_all_conditions(mutable_state) is True
 
     if_config = AutomationIf(
         source="switchbot",
@@ -523,7 +544,7 @@ def test_check_conditions_combined_conditions(sample_state: StateObject):
         },
     )
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+    assert trigger._check_all_conditions(mutable_state) is False
 
     if_config = AutomationIf(
         source="switchbot",
@@ -533,24 +554,24 @@ def test_check_conditions_combined_conditions(sample_state: StateObject):
         },
     )
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+    assert trigger._check_all_conditions(mutable_state) is False
 
 
-def test_check_conditions_invalid_operator(sample_state: StateObject):
+def test_check_conditions_invalid_operator(mutable_state: StateObject):
     """Test that an invalid operator returns False."""
-    sample_state._cached_values = {"temperature": 25.0}
+    mutable_state._cached_values = {"temperature": 25.0}
     if_config = AutomationIf(
         source="switchbot", conditions={"temperature": "invalid_op 20"}
     )
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+    assert trigger._check_all_conditions(mutable_state) is False
 
 
-def test_check_conditions_invalid_value_type(sample_state: StateObject):
+def test_check_conditions_invalid_value_type(mutable_state: StateObject):
     """Test that a condition with a non-comparable value returns False."""
-    sample_state._cached_values = {"temperature": 25.0}
+    mutable_state._cached_values = {"temperature": 25.0}
     if_config = AutomationIf(
         source="switchbot", conditions={"temperature": "> non_numeric_value"}
     )
     trigger = EdgeTrigger(if_config)
-    assert trigger._check_all_conditions(sample_state) is False
+    assert trigger._check_all_conditions(mutable_state) is False
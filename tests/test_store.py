@@ -10,7 +10,7 @@ def storage():
     return StateStore()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_state(mock_switchbot_advertisement):
     """Creates a mock state object that behaves like a SwitchBotAdvertisement."""
     state = mock_switchbot_advertisement(
@@ -116,3 +116,28 @@ async def test_get_and_update_state(storage, mock_state, mock_switchbot_advertis
 
     # Verify that other keys are unaffected
     assert len(await storage.get_all()) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_many_returns_only_requested_keys(storage, mock_state):
+    """Test that get_many copies only the requested keys that have a state."""
+    await storage.get_and_update("DE:AD:BE:EF:00:01", mock_state)
+    await storage.get_and_update("DE:AD:BE:EF:00:02", mock_state)
+
+    result = await storage.get_many(["DE:AD:BE:EF:00:01", "unknown"])
+
+    assert result == {"DE:AD:BE:EF:00:01": mock_state}
+    result.clear()
+    assert len(await storage.get_all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_returns_copy(storage, mock_state):
+    """Test that get_all returns a point-in-time copy of the store."""
+    all_states = await storage.get_all()
+
+    await storage.get_and_update("DE:AD:BE:EF:00:01", mock_state)
+    assert all_states == {}
+
+    all_states["DE:AD:BE:EF:00:02"] = mock_state
+    assert await storage.get_all() == {"DE:AD:BE:EF:00:01": mock_state}
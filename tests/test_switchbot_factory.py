@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,11 +12,12 @@ from switchbot_actions.switchbot_factory import (
 
 @pytest.fixture
 def mock_advertisement():
-    """Fixture to create a mock SwitchBotAdvertisement object."""
-    mock_adv = Mock(spec=switchbot.SwitchBotAdvertisement)
-    mock_adv.device = "AA:BB:CC:DD:EE:FF"
-    mock_adv.data = {"modelName": "Bot"}  # Default modelName
-    return mock_adv
+    """Fixture to create a stand-in SwitchBotAdvertisement object."""
+    # Only .device and .data are read, so a plain namespace is sufficient.
+    return SimpleNamespace(
+        device="AA:BB:CC:DD:EE:FF",
+        data={"modelName": "Bot"},  # Default modelName
+    )
 
 
 def test_create_switchbot_device_valid_model(mock_advertisement):
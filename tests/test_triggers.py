@@ -1,4 +1,7 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import copy
+import operator
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -9,10 +12,15 @@ from switchbot_actions.triggers import (
     EdgeTrigger,
 )
 
+# StateObject's attribute names, resolved once for every state mock below.
+# Passing names rather than the class keeps the missing-attribute behaviour
+# while skipping Mock's per-instance introspection of the class.
+STATE_OBJECT_SPEC = dir(StateObject)
+
 
 @pytest.fixture
 def mock_state_object():
-    state = MagicMock(spec=StateObject)
+    state = MagicMock(spec=STATE_OBJECT_SPEC)
     state.id = "test_device"
     state.get_values_dict.return_value = {"some_key": "some_value"}
     state.format.side_effect = lambda x: x  # Default to no formatting for simplicity
@@ -22,37 +30,65 @@ def mock_state_object():
     return state
 
 
+class RecordingAction:
+    """An async action stand-in that records the states it was called with."""
+
+    def __init__(self):
+        self.calls: list = []
+
+    async def __call__(self, state):
+        self.calls.append(state)
+
+
 @pytest.fixture
 def mock_action():
-    return AsyncMock()
+    return RecordingAction()
 
 
 @pytest.fixture
+def make_trigger(mock_action):
+    """
+    Builds a trigger wired to mock_action whose condition checks return the
+    scripted results in order. Pass an iterator to check afterwards that every
+    scripted result was consumed.
+    """
+
+    def _make(trigger_cls, condition_block, checks):
+        trigger = trigger_cls(condition_block)
+        trigger.on_triggered(mock_action)
+        remaining = iter(checks)
+        trigger._check_all_conditions = lambda state: next(remaining)
+        return trigger
+
+    return _make
+
+
+@pytest.fixture(scope="module")
 def mock_condition_block():
-    cb = MagicMock(spec=ConditionBlock)
-    cb.name = "TestRule"
-    cb.duration = None  # Default for EdgeTrigger
-    cb.source = "switchbot"
-    cb.topic = None
-    cb.conditions = {"some_key": "== some_value"}
-    return cb
+    return SimpleNamespace(
+        name="TestRule",
+        duration=None,  # Default for EdgeTrigger
+        source="switchbot",
+        topic=None,
+        conditions={"some_key": "== some_value"},
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_duration_condition_block():
-    cb = MagicMock(spec=ConditionBlock)
-    cb.name = "DurationTestRule"
-    cb.duration = 1.0
-    cb.source = "switchbot"
-    cb.topic = None
-    cb.conditions = {"some_key": "== some_value"}
-    return cb
+    return SimpleNamespace(
+        name="DurationTestRule",
+        duration=1.0,
+        source="switchbot",
+        topic=None,
+        conditions={"some_key": "== some_value"},
+    )
 
 
 class TestCheckAllConditions:
     @pytest.fixture
     def state_with_previous(self, mock_state_object):
-        prev_state = MagicMock(spec=StateObject)
+        prev_state = MagicMock(spec=STATE_OBJECT_SPEC)
         prev_state.temperature = 25.0
         prev_state.humidity = 45.0
         prev_state.format.side_effect = lambda x: x
@@ -108,7 +144,7 @@ class TestCheckAllConditions:
         expected_result,
     ):
         mock_state_object.temperature = current_temp
-        prev_state = MagicMock(spec=StateObject)
+        prev_state = MagicMock(spec=STATE_OBJECT_SPEC)
         prev_state.temperature = previous_temp
         prev_state.format.side_effect = lambda x: x
         mock_state_object.previous = prev_state
@@ -201,154 +237,143 @@ class TestCheckAllConditions:
 
 class TestEdgeTrigger:
     # 3.2. Stateless EdgeTrigger tests
-    # 3.2.1. Normal case (rising edge)
-    @pytest.mark.asyncio
-    async def test_process_state_rising_edge(
-        self, mock_state_object, mock_action, mock_condition_block
+    # 3.2.1. Normal case (rising edge) and 3.2.2. semi-normal cases (no edge)
+    @pytest.mark.parametrize(
+        "checks, expected_fired",
+        [
+            pytest.param([True, False], True, id="rising_edge"),
+            pytest.param([True, True], False, id="no_edge_true_true"),
+            pytest.param([False, False], False, id="no_edge_false_false"),
+            pytest.param([False, True], False, id="falling_edge_true_false"),
+        ],
+    )
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_process_state_transition(
+        self,
+        mock_state_object,
+        mock_action,
+        mock_condition_block,
+        make_trigger,
+        checks,
+        expected_fired,
     ):
-        trigger = EdgeTrigger[StateObject](mock_condition_block)
-        trigger.on_triggered(mock_action)
+        # Checks are scripted as [current state, previous state]
+        remaining = iter(checks)
+        trigger = make_trigger(
+            EdgeTrigger[StateObject], mock_condition_block, remaining
+        )
+        mock_state_object.previous = MagicMock(spec=STATE_OBJECT_SPEC)
 
-        # Simulate False -> True transition
-        # state.previous is False, state is True
-        mock_state_object.previous = MagicMock(spec=StateObject)
-        with patch.object(
-            trigger, "_check_all_conditions", side_effect=[True, False]
-        ) as mock_check_conditions:
-            await trigger.process_state(mock_state_object)
-            mock_action.assert_called_once_with(mock_state_object)
-            assert (
-                mock_check_conditions.call_count == 2
-            )  # Called for current and previous state
+        await trigger.process_state(mock_state_object)
+        # Every scripted check is consumed: one for current, one for previous
+        assert (mock_action.calls, next(remaining, None)) == (
+            [mock_state_object] if expected_fired else [],
+            None,
+        )
 
-    # 3.2.2. Semi-normal case (no edge)
-    @pytest.mark.asyncio
-    async def test_process_state_no_edge_true_true(
-        self, mock_state_object, mock_action, mock_condition_block
+    # 3.2.3. Initial event test
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_process_state_initial_event_no_previous(
+        self, mock_state_object, mock_action, mock_condition_block, make_trigger
     ):
-        trigger = EdgeTrigger[StateObject](mock_condition_block)
-        trigger.on_triggered(mock_action)
+        # Simulate an empty conditions block; the shared block is left untouched
+        condition_block = copy.copy(mock_condition_block)
+        condition_block.conditions = {}
+        remaining = iter([True])
+        trigger = make_trigger(EdgeTrigger[StateObject], condition_block, remaining)
 
-        # Simulate True -> True transition
-        mock_state_object.previous = MagicMock(spec=StateObject)
-        with patch.object(
-            trigger, "_check_all_conditions", side_effect=[True, True]
-        ) as mock_check_conditions:
-            await trigger.process_state(mock_state_object)
-            mock_action.assert_not_called()
-            assert mock_check_conditions.call_count == 2
+        # state.previous is None
+        mock_state_object.previous = None
 
-    @pytest.mark.asyncio
-    async def test_process_state_no_edge_false_false(
-        self, mock_state_object, mock_action, mock_condition_block
-    ):
-        trigger = EdgeTrigger[StateObject](mock_condition_block)
-        trigger.on_triggered(mock_action)
+        await trigger.process_state(mock_state_object)
+        # _check_all_conditions is called once, for the current state only
+        assert (mock_action.calls, next(remaining, None)) == ([mock_state_object], None)
 
-        # Simulate False -> False transition
-        mock_state_object.previous = MagicMock(spec=StateObject)
-        with patch.object(
-            trigger, "_check_all_conditions", side_effect=[False, False]
-        ) as mock_check_conditions:
-            await trigger.process_state(mock_state_object)
-            mock_action.assert_not_called()
-            assert mock_check_conditions.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_process_state_falling_edge_true_false(
-        self, mock_state_object, mock_action, mock_condition_block
-    ):
-        trigger = EdgeTrigger[StateObject](mock_condition_block)
-        trigger.on_triggered(mock_action)
+async def _noop_sleep(*args, **kwargs):
+    return None
 
-        # Simulate True -> False transition (falling edge)
-        mock_state_object.previous = MagicMock(spec=StateObject)
-        with patch.object(
-            trigger, "_check_all_conditions", side_effect=[False, True]
-        ) as mock_check_conditions:
-            await trigger.process_state(mock_state_object)
-            mock_action.assert_not_called()
-            assert mock_check_conditions.call_count == 2
 
-    # 3.2.3. Initial event test
-    @pytest.mark.asyncio
-    async def test_process_state_initial_event_no_previous(
-        self, mock_state_object, mock_action, mock_condition_block
-    ):
-        trigger = EdgeTrigger[StateObject](mock_condition_block)
-        trigger.on_triggered(mock_action)
+class RecordingTimer:
+    """A Timer stand-in that records start() instead of scheduling a task."""
 
-        # Simulate an empty conditions block
-        mock_condition_block.conditions = {}
+    def __init__(self, duration_sec, callback, name=""):
+        self.started = False
 
-        # state.previous is None
-        mock_state_object.previous = None
-        with patch.object(
-            trigger, "_check_all_conditions", return_value=True
-        ) as mock_check_conditions:
-            await trigger.process_state(mock_state_object)
-            mock_action.assert_called_once_with(mock_state_object)
-            # _check_all_conditions is called once for the current state
-            mock_check_conditions.assert_called_once_with(mock_state_object)
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
 
 
 class TestDurationTrigger:
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def no_timer_sleep(self, monkeypatch):
+        """Keeps started timers from actually waiting out their duration."""
+        monkeypatch.setattr("switchbot_actions.timers.asyncio.sleep", _noop_sleep)
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_process_state_duration_met(
-        self, mock_state_object, mock_action, mock_duration_condition_block
+        self,
+        mock_state_object,
+        mock_action,
+        mock_duration_condition_block,
+        make_trigger,
+        monkeypatch,
     ):
-        trigger = DurationTrigger[StateObject](mock_duration_condition_block)
-        trigger.on_triggered(mock_action)
+        # The timer's completion is simulated below, so no task is scheduled
+        monkeypatch.setattr("switchbot_actions.triggers.Timer", RecordingTimer)
+        trigger = make_trigger(
+            DurationTrigger[StateObject], mock_duration_condition_block, [True]
+        )
 
-        with (
-            patch.object(trigger, "_check_all_conditions", return_value=True),
-            patch("asyncio.sleep", new=AsyncMock()),
-        ):
-            await trigger.process_state(
-                mock_state_object
-            )  # Conditions met, timer starts
-
-            # Simulate timer completion
-            await trigger._timer_callback(mock_state_object)
-            mock_action.assert_called_once_with(mock_state_object)
-            assert mock_state_object.id not in trigger._active_timers
-
-    @pytest.mark.asyncio
-    async def test_process_state_duration_not_met(
-        self, mock_state_object, mock_action, mock_duration_condition_block
-    ):
-        trigger = DurationTrigger[StateObject](mock_duration_condition_block)
-        trigger.on_triggered(mock_action)
+        sid = mock_state_object.id
+
+        await trigger.process_state(mock_state_object)  # Conditions met, timer starts
+        timer = trigger._active_timers[sid]
+        assert isinstance(timer, RecordingTimer)
+        assert timer.started is True
 
-        with (
-            patch.object(trigger, "_check_all_conditions", side_effect=[True, False]),
-            patch("asyncio.sleep", new=AsyncMock()),
-        ):
-            await trigger.process_state(
-                mock_state_object
-            )  # Conditions met, timer starts
-            assert mock_state_object.id in trigger._active_timers
-
-            await trigger.process_state(
-                mock_state_object
-            )  # Conditions are no longer met, timer stops.
-            mock_action.assert_not_called()
-            assert mock_state_object.id not in trigger._active_timers
-
-    @pytest.mark.asyncio
-    async def test_process_state_no_conditions_met(
-        self, mock_state_object, mock_action, mock_duration_condition_block
+        # Simulate timer completion
+        await trigger._timer_callback(mock_state_object)
+        assert (mock_action.calls, sid in trigger._active_timers) == (
+            [mock_state_object],
+            False,
+        )
+
+    @pytest.mark.parametrize(
+        "checks, timer_active_after",
+        [
+            pytest.param([True, False], [True, False], id="duration_not_met"),
+            pytest.param([False], [False], id="no_conditions_met"),
+        ],
+    )
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_process_state_without_completion(
+        self,
+        mock_state_object,
+        mock_action,
+        mock_duration_condition_block,
+        make_trigger,
+        checks,
+        timer_active_after,
     ):
-        trigger = DurationTrigger[StateObject](mock_duration_condition_block)
-        trigger.on_triggered(mock_action)
+        trigger = make_trigger(
+            DurationTrigger[StateObject], mock_duration_condition_block, checks
+        )
+
+        sid = mock_state_object.id
 
-        with (
-            patch.object(trigger, "_check_all_conditions", return_value=False),
-            patch("asyncio.sleep", new=AsyncMock()),
-        ):
+        # A timer starts when conditions become met and stops when they no
+        # longer are; the action never runs without the timer completing
+        for timer_active in timer_active_after:
             await trigger.process_state(mock_state_object)
-            mock_action.assert_not_called()
-            assert mock_state_object.id not in trigger._active_timers
+            assert (
+                sid in trigger._active_timers,
+                trigger._rule_conditions_met.get(sid, False),
+            ) == (timer_active, timer_active)
+        assert mock_action.calls == []
 
 
 # 3.3. Test of _evaluate_single_condition
@@ -366,6 +391,7 @@ class TestDurationTrigger:
         # Float comparisons
         ("== 10.5", 10.5, True),
         ("> 10.0", 10.5, True),
+        ("25", 25.0, True),
         # String comparisons
         ("== hello", "hello", True),
         ("!= world", "hello", True),
@@ -378,8 +404,10 @@ class TestDurationTrigger:
         ("10", 10, True),
         ("hello", "hello", True),
         ("true", True, True),
+        ("false", False, True),
         # Type mismatch
         ("== 10", "hello", False),
+        ("invalid", 123, False),
         # None value
         ("== 10", None, False),
     ],
@@ -390,10 +418,99 @@ def test_evaluate_single_condition(condition, new_value, expected):
     assert _evaluate_single_condition(condition, new_value) == expected
 
 
+@pytest.mark.parametrize(
+    "condition, expected_op, expected_operand, expected_number",
+    [
+        ("> 5", operator.gt, "5", 5.0),
+        ("<= 10.5", operator.le, "10.5", 10.5),
+        ("< -60", operator.lt, "-60", -60.0),
+        ("== 1e3", operator.eq, "1e3", 1000.0),
+        ("!= hello world", operator.ne, "hello world", None),
+        ("hello world", operator.eq, "hello world", None),
+        ("=> 5", operator.eq, "=> 5", None),
+        ("true", operator.eq, "true", None),
+    ],
+)
+def test_compile_condition(condition, expected_op, expected_operand, expected_number):
+    from switchbot_actions.triggers import _compile_condition
+
+    assert _compile_condition(condition) == (
+        expected_op,
+        expected_operand,
+        expected_number,
+    )
+
+
+@pytest.mark.parametrize(
+    "conditions, expected",
+    [
+        ({"temperature": "> 15", "humidity": "== 50"}, True),
+        ({"temperature": "> 15", "humidity": "!= 50"}, False),
+        ({"temperature": "> 15", "missing_key": "1"}, False),
+    ],
+)
+def test_check_all_conditions_reuses_prepared_literal_conditions(
+    mock_state_object, conditions, expected
+):
+    del mock_state_object.missing_key
+    trigger = EdgeTrigger(ConditionBlock(source="switchbot", conditions=conditions))
+    assert trigger._check_all_conditions(mock_state_object) is expected
+
+    # Later events compare against the conditions compiled on first use
+    with patch("switchbot_actions.triggers._compile_condition") as mock_compile:
+        assert trigger._check_all_conditions(mock_state_object) is expected
+    mock_compile.assert_not_called()
+    mock_state_object.format.assert_not_called()
+
+
+def test_prepare_conditions_resolves_keys_once():
+    prepared = EdgeTrigger._prepare_conditions(
+        {
+            "temperature": "> 20",
+            "living_meter.humidity": "< {humidity}",
+            "previous.temperature": "!= 25.0",
+        }
+    )
+
+    assert prepared == (
+        ("temperature", None, "temperature", "> 20", (operator.gt, "20", 20.0)),
+        (
+            "previous.temperature",
+            "previous",
+            "temperature",
+            "!= 25.0",
+            (operator.ne, "25.0", 25.0),
+        ),
+        ("living_meter.humidity", "living_meter", "humidity", "< {humidity}", None),
+    )
+
+
+def test_prepare_conditions_orders_cheap_conditions_first():
+    prepared = EdgeTrigger._prepare_conditions(
+        {
+            "temperature": "> {previous.temperature}",
+            "living_meter.temperature": "> 25",
+            "previous.humidity": "< 50",
+            "modelName": "WoSensorTH",
+            "humidity": "> 40",
+            "address": "11:22:33:44:55:66",
+        }
+    )
+
+    assert [entry[0] for entry in prepared] == [
+        "address",
+        "modelName",
+        "humidity",
+        "previous.humidity",
+        "living_meter.temperature",
+        "temperature",
+    ]
+
+
 @pytest.fixture
 def mock_state_with_snapshot(mock_state_object):
     """A mock state object that has a snapshot of other devices."""
-    living_meter_state = MagicMock(spec=StateObject)
+    living_meter_state = MagicMock(spec=STATE_OBJECT_SPEC)
     living_meter_state.temperature = 26.0
     living_meter_state.humidity = 40.0
     living_meter_state.format.side_effect = lambda x: x